@@ -2,7 +2,7 @@ import importlib.util
 import logging
 import os
 from pathlib import Path
-from typing import Annotated, AsyncGenerator
+from typing import Annotated, Any, AsyncGenerator, Optional
 
 import uvicorn
 from colorama import Fore, Style
@@ -24,6 +24,7 @@ from inertia import (
 from morph.api.error import ApiBaseError, InternalError, render_error_html
 from morph.api.handler import router
 from morph.api.plugin import plugin_app
+from morph.api.service import clear_partial_load_cache
 from morph.task.utils.morph import find_project_root_dir
 from morph.task.utils.run_backend.state import (
     MorphFunctionMetaObjectCacheManager,
@@ -41,13 +42,13 @@ logger.setLevel(logging.INFO)
 # set true to MORPH_LOCAL_DEV_MODE to use local frontend server
 is_local_dev_mode = True if os.getenv("MORPH_LOCAL_DEV_MODE") == "true" else False
 
-project_root = find_project_root_dir()
-
 
 def custom_compile_logic():
     logger.info("Compiling python and sql files...")
     context = MorphGlobalContext.get_instance()
-    errors = context.load(project_root)
+    errors = context.load(find_project_root_dir())
+    # a full load replaces the meta objects the alias pre-checks were based on
+    clear_partial_load_cache()
     if len(errors) > 0:
         error_message = "\n---\n".join(
             [
@@ -118,19 +119,106 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down...")
 
 
-app = FastAPI(lifespan=lifespan)
-app.add_middleware(SessionMiddleware, secret_key="secret_key")
-app.add_exception_handler(
-    InertiaVersionConflictException,
-    inertia_version_conflict_exception_handler,
-)
-app.add_exception_handler(
-    RequestValidationError,
-    inertia_request_validation_exception_handler,
-)
+def create_app() -> FastAPI:
+    project_root = find_project_root_dir()
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(SessionMiddleware, secret_key="secret_key")
+    app.add_exception_handler(
+        InertiaVersionConflictException,
+        inertia_version_conflict_exception_handler,
+    )
+    app.add_exception_handler(
+        RequestValidationError,
+        inertia_request_validation_exception_handler,
+    )
+
+    inertia_config = get_inertia_config(project_root)
+
+    InertiaDep = Annotated[Inertia, Depends(inertia_dependency_factory(inertia_config))]
+
+    if is_local_dev_mode:
+        app.mount(
+            "/src",
+            StaticFiles(directory=os.path.join(project_root, "src")),
+            name="src",
+        )
+    else:
+        app.mount(
+            "/assets",
+            StaticFiles(directory=os.path.join(project_root, "dist", "assets")),
+            name="assets",
+        )
+
+    app.mount(
+        "/static",
+        StaticFiles(directory=os.path.join(os.getcwd(), "static"), check_dir=False),
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.exception_handler(ApiBaseError)
+    async def handle_morph_error(_, exc):
+        return JSONResponse(
+            status_code=exc.status,
+            content={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "detail": exc.detail,
+                }
+            },
+        )
+
+    @app.exception_handler(Exception)
+    async def handle_other_error(_, exc):
+        exc = InternalError()
+        return JSONResponse(
+            status_code=exc.status,
+            content={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "detail": exc.detail,
+                }
+            },
+        )
+
+    @app.get("/", response_model=None)
+    async def index(inertia: InertiaDep) -> InertiaResponse:
+        return await inertia.render("index", {"showAdminPage": is_local_dev_mode})
+
+    @app.get(
+        "/health",
+    )
+    async def health_check():
+        return {"message": "ok"}
+
+    app.include_router(router)
+
+    import_plugins(app)
+
+    @app.get("/morph", response_model=None)
+    async def morph(inertia: InertiaDep) -> InertiaResponse:
+        if is_local_dev_mode:
+            return await inertia.render("morph", {"showAdminPage": True})
+
+        return await inertia.render("404", {"showAdminPage": False})
 
+    @app.get("/{full_path:path}", response_model=None)
+    async def subpages(full_path: str, inertia: InertiaDep) -> InertiaResponse:
+        return await inertia.render(full_path, {"showAdminPage": is_local_dev_mode})
 
-def get_inertia_config():
+    return app
+
+
+def get_inertia_config(project_root: str) -> InertiaConfig:
     templates_dir = os.path.join(Path(__file__).resolve().parent, "templates")
 
     if is_local_dev_mode:
@@ -159,83 +247,7 @@ def get_inertia_config():
     )
 
 
-inertia_config = get_inertia_config()
-
-InertiaDep = Annotated[Inertia, Depends(inertia_dependency_factory(inertia_config))]
-
-if is_local_dev_mode:
-    app.mount(
-        "/src",
-        StaticFiles(directory=os.path.join(project_root, "src")),
-        name="src",
-    )
-else:
-    app.mount(
-        "/assets",
-        StaticFiles(directory=os.path.join(project_root, "dist", "assets")),
-        name="assets",
-    )
-
-app.mount(
-    "/static",
-    StaticFiles(directory=os.path.join(os.getcwd(), "static"), check_dir=False),
-)
-
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-@app.exception_handler(ApiBaseError)
-async def handle_morph_error(_, exc):
-    return JSONResponse(
-        status_code=exc.status,
-        content={
-            "error": {
-                "code": exc.code,
-                "message": exc.message,
-                "detail": exc.detail,
-            }
-        },
-    )
-
-
-@app.exception_handler(Exception)
-async def handle_other_error(_, exc):
-    exc = InternalError()
-    return JSONResponse(
-        status_code=exc.status,
-        content={
-            "error": {
-                "code": exc.code,
-                "message": exc.message,
-                "detail": exc.detail,
-            }
-        },
-    )
-
-
-@app.get("/", response_model=None)
-async def index(inertia: InertiaDep) -> InertiaResponse:
-    return await inertia.render("index", {"showAdminPage": is_local_dev_mode})
-
-
-@app.get(
-    "/health",
-)
-async def health_check():
-    return {"message": "ok"}
-
-
-app.include_router(router)
-
-
-def import_plugins():
+def import_plugins(app: FastAPI) -> None:
     plugin_dir = Path(os.getcwd()) / "src/plugin"
     if plugin_dir.exists():
         for file in plugin_dir.glob("**/*.py"):
@@ -257,25 +269,23 @@ def import_plugins():
     app.mount("/api/plugin", plugin_app)
 
 
-import_plugins()
-
-
-@app.get("/morph", response_model=None)
-async def morph(inertia: InertiaDep) -> InertiaResponse:
-    if is_local_dev_mode:
-        return await inertia.render("morph", {"showAdminPage": True})
-
-    return await inertia.render("404", {"showAdminPage": False})
+_app: Optional[FastAPI] = None
 
 
-@app.get("/{full_path:path}", response_model=None)
-async def subpages(full_path: str, inertia: InertiaDep) -> InertiaResponse:
-    return await inertia.render(full_path, {"showAdminPage": is_local_dev_mode})
+def __getattr__(name: str) -> Any:
+    # build the app on first access (e.g. uvicorn loading "morph.api.app:app")
+    # so that importing this module does not set up templates and static mounts
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     uvicorn.run(
-        app,
+        create_app(),
         host="0.0.0.0",
         port=8080,
         reload=False,
@@ -1,6 +1,7 @@
 import base64
 import json
 import os
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Header
 
@@ -9,6 +10,37 @@ from morph.api.context import request_context
 from morph.api.error import AuthError, ErrorCode, ErrorMessage
 from morph.task.utils.morph import find_project_root_dir
 
+# user context used when running in local without a mock json
+_DEFAULT_DUMMY_USER: Dict[str, Any] = UserInfo(
+    user_id="cea122ea-b240-49d7-ae7f-8b1e3d40dd8f",
+    email="mock_user@morph-data.io",
+    username="mock_user",
+    first_name="Mock",
+    last_name="User",
+    roles=["Admin"],
+).model_dump()
+
+# mock user context keyed by (path, mtime) to skip re-reading it on every request
+_MOCK_CACHE: Optional[Tuple[Tuple[str, int], Dict[str, Any]]] = None
+
+
+def _load_mock_user(mock_json_path: str, mtime_ns: int) -> Dict[str, Any]:
+    global _MOCK_CACHE
+
+    key = (mock_json_path, mtime_ns)
+    if _MOCK_CACHE is not None and _MOCK_CACHE[0] == key:
+        return _MOCK_CACHE[1]
+
+    try:
+        with open(mock_json_path) as f:
+            mock_json: Dict[str, Any] = json.load(f)
+    except Exception:
+        raise AuthError(
+            ErrorCode.AuthError, ErrorMessage.AuthErrorMessage["mockJsonInvalid"]
+        )
+    _MOCK_CACHE = (key, mock_json)
+    return mock_json
+
 
 async def auth(
     authorization: str = Header(default=None), x_api_key: str = Header(default=None)
@@ -20,28 +52,13 @@ async def auth(
         # "dummy" is set when running in local
         project_root = find_project_root_dir()
         mock_json_path = f"{project_root}/.mock_user_context.json"
-        if not os.path.exists(mock_json_path):
-            request_context.set(
-                {
-                    "user": UserInfo(
-                        user_id="cea122ea-b240-49d7-ae7f-8b1e3d40dd8f",
-                        email="mock_user@morph-data.io",
-                        username="mock_user",
-                        first_name="Mock",
-                        last_name="User",
-                        roles=["Admin"],
-                    ).model_dump()
-                }
-            )
-            return
         try:
-            mock_json = json.load(open(mock_json_path))
-            request_context.set({"user": mock_json})
+            mtime_ns = os.stat(mock_json_path).st_mtime_ns
+        except FileNotFoundError:
+            request_context.set({"user": _DEFAULT_DUMMY_USER})
             return
-        except Exception:
-            raise AuthError(
-                ErrorCode.AuthError, ErrorMessage.AuthErrorMessage["mockJsonInvalid"]
-            )
+        request_context.set({"user": _load_mock_user(mock_json_path, mtime_ns)})
+        return
 
     try:
         token = authorization.split(" ")[1]
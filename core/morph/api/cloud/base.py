@@ -1,14 +1,35 @@
 import urllib.parse
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, Optional, Type, TypeVar
 
 import requests
 from pydantic import BaseModel
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Returns the session shared by Morph API calls and image uploads, so that
+    connections and their TLS handshakes are reused across requests.
+    """
+    session = requests.Session()
+    # only connection failures are retried since request bodies may be streamed
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, read=0, status=0, backoff_factor=0.5),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class MorphClientResponse(Response):
     def __init__(self, response: Response):
         super().__init__()
@@ -93,7 +114,7 @@ class MorphApiBaseClient(ABC):
             print(f"Data: {data}")
             print(f"Query: {query}")
 
-        response = requests.request(
+        response = get_http_session().request(
             method=method, url=url, headers=headers, json=data, verify=True
         )
 
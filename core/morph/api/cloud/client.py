@@ -1,7 +1,6 @@
-import configparser
 import os
 from functools import wraps
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, cast
+from typing import Any, Dict, FrozenSet, Generic, List, Optional, Tuple, Type, TypeVar
 
 from morph.api.cloud.base import MorphApiBaseClient, MorphClientResponse
 from morph.api.cloud.types import EnvVarObject
@@ -10,6 +9,42 @@ from morph.task.utils.morph import find_project_root_dir
 
 MORPH_API_BASE_URL = "https://api.squadbase.dev/v0"
 
+# parsed credentials keyed by (path, mtime) so edits to the file are picked up
+_CREDS_CACHE: Dict[Tuple[str, int], Dict[str, Dict[str, str]]] = {}
+
+
+def parse_credentials_file(path: str) -> Dict[str, Dict[str, str]]:
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    with open(path, "r") as f:
+        for raw_line in f.read().splitlines():
+            line = raw_line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                current = sections.setdefault(line[1:-1].strip(), {})
+            elif current is not None and "=" in line:
+                key, value = line.split("=", 1)
+                current[key.strip().lower()] = value.strip()
+    return sections
+
+
+def _read_credentials(config_path: str) -> Dict[str, Dict[str, str]]:
+    key = (config_path, os.stat(config_path).st_mtime_ns)
+    credentials = _CREDS_CACHE.get(key)
+    if credentials is None:
+        credentials = parse_credentials_file(config_path)
+        _CREDS_CACHE.clear()
+        _CREDS_CACHE[key] = credentials
+    return credentials
+
+
+def _load_project(project_root: str) -> Any:
+    # load_project memoizes the parsed file itself until the file changes
+    from morph.config.project import load_project  # avoid circular import
+
+    return load_project(project_root)
+
 
 def validate_project_id(method):
     @wraps(method)
@@ -30,15 +65,13 @@ class MorphApiKeyClientImpl(MorphApiBaseClient):
         self.api_url = os.environ.get("MORPH_BASE_URL", MORPH_API_BASE_URL)
         self.api_key = os.environ.get("MORPH_API_KEY", "")
 
-        from morph.config.project import load_project  # avoid circular import
-
         try:
             project_root = find_project_root_dir()
         except Exception:  # noqa
             project_root = None
 
         if project_root:
-            project = load_project(project_root)
+            project = _load_project(project_root)
         else:
             project = None
 
@@ -54,28 +87,30 @@ class MorphApiKeyClientImpl(MorphApiBaseClient):
         self.api_key = os.environ.get("MORPH_API_KEY", "")
         if not self.api_key:
             config_path = MorphConstant.MORPH_CRED_PATH
-            if not os.path.exists(config_path):
+            try:
+                credentials = _read_credentials(config_path)
+            except FileNotFoundError:
                 raise ValueError(
                     f"Credential file not found at {config_path}. Please run 'morph init'."
                 )
-            config = configparser.ConfigParser()
-            config.read(config_path)
-            if not config.has_section(profile):
+            if profile not in credentials:
                 raise ValueError(
                     f"No profile '{profile}' found in the credentials file."
                 )
-            self.api_key = config.get(profile, "api_key", fallback="")
+            self.api_key = credentials[profile].get("api_key", "")
 
         if not self.api_key:
             raise ValueError(f"No API key found for profile '{profile}'.")
 
-    def get_headers(self) -> Dict[str, Any]:
-        return {
-            "Contet-Type": "application/json",
+        self._headers: Dict[str, Any] = {
+            "Content-Type": "application/json",
             "X-Api-Key": self.api_key,
             "project-id": self.project_id,
         }
 
+    def get_headers(self) -> Dict[str, Any]:
+        return self._headers
+
     def get_base_url(self) -> str:
         return self.api_url
 
@@ -164,12 +199,12 @@ class MorphApiKeyClientImpl(MorphApiBaseClient):
 T = TypeVar("T", bound=MorphApiBaseClient)
 
 
+# client implementations that MorphApiClient is allowed to construct
+_ALLOWED_CLIENTS: FrozenSet[type] = frozenset({MorphApiKeyClientImpl})
+
+
 class MorphApiClient(Generic[T]):
     def __init__(self, client_class: Type[T], token: Optional[str] = None):
-        self.req: T = self._create_client(client_class, token=token)
-
-    def _create_client(self, client_class: Type[T], token: Optional[str] = None) -> T:
-        if client_class is MorphApiKeyClientImpl:
-            return cast(T, MorphApiKeyClientImpl())
-        else:
+        if client_class not in _ALLOWED_CLIENTS:
             raise ValueError("Invalid client class.")
+        self.req: T = client_class()
@@ -1,15 +1,14 @@
 import asyncio
-import io
 import json
 import logging
 import os
+import shutil
 import tempfile
 import time
 import uuid
-from contextlib import redirect_stdout
-from typing import Any
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Literal, NoReturn, Optional, Tuple, cast
 
-import click
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 
@@ -22,54 +21,146 @@ from morph.api.custom_types import (
     UploadFileService,
 )
 from morph.api.error import ErrorCode, ErrorMessage, RequestError, WarningError
-from morph.api.utils import (
-    convert_file_output,
-    convert_variables_values,
-    set_command_args,
-)
-from morph.cli.flags import Flags
-from morph.task.resource import PrintResourceTask
-from morph.task.run import RunTask
+from morph.api.utils import convert_file_output, convert_variables_values
 from morph.task.utils.morph import find_project_root_dir
-from morph.task.utils.run_backend.errors import MorphFunctionLoadError
-from morph.task.utils.run_backend.state import MorphGlobalContext
-from morph.task.utils.run_backend.types import RunStatus
 
 logger = logging.getLogger("uvicorn")
 
+# source signature at which each (project_root, alias) last loaded without errors.
+# The signature covers the same source directory checksums that partial_load
+# validates, so editing or removing a source file makes the alias load again.
+_PARTIAL_LOAD_SIGNATURES: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+
+# sentinel returned by next() once a streaming generator is exhausted
+_STREAM_END = object()
+
+
+def _project_mtime_ns(project_root: str) -> int:
+    for project_yaml_file in ["morph_project.yml", "morph_project.yaml"]:
+        try:
+            return os.stat(os.path.join(project_root, project_yaml_file)).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return 0
+
+
+def _source_signature(project_root: str) -> Tuple[Any, ...]:
+    from morph.config.project import load_project
+    from morph.task.utils.run_backend.inspection import get_checksum
+
+    project = load_project(project_root)
+    source_paths = project.source_paths if project is not None else []
+    if len(source_paths) == 0:
+        compare_dirs = [Path(project_root)]
+    else:
+        compare_dirs = [Path(project_root, path) for path in source_paths]
+
+    checksums = [
+        get_checksum(compare_dir) if compare_dir.exists() else ""
+        for compare_dir in compare_dirs
+    ]
+    return (_project_mtime_ns(project_root), *checksums)
+
+
+def _partial_load(context: Any, project_root: str, name: str) -> List[Any]:
+    key = (project_root, name)
+    signature = _source_signature(project_root)
+    if _PARTIAL_LOAD_SIGNATURES.get(key) == signature:
+        return []
+
+    errors: List[Any] = context.partial_load(project_root, name)
+    if len(errors) == 0:
+        _PARTIAL_LOAD_SIGNATURES[key] = signature
+    else:
+        _PARTIAL_LOAD_SIGNATURES.pop(key, None)
+    return errors
+
+
+def clear_partial_load_cache() -> None:
+    _PARTIAL_LOAD_SIGNATURES.clear()
+
+
+def _raise_run_error(error: Optional[str]) -> NoReturn:
+    if error is None:
+        raise WarningError(
+            ErrorCode.ExecutionError,
+            ErrorMessage.ExecutionErrorMessage["executionFailed"],
+        )
+
+    # errors are usually plain text, so only parse the ones that can be a RequestError
+    if "RequestError" in error:
+        try:
+            error_obj = json.loads(error)
+        except Exception:  # noqa
+            error_obj = None
+        if isinstance(error_obj, dict) and "RequestError" in error_obj:
+            raise RequestError(
+                ErrorCode.RequestError,
+                ErrorMessage.RequestErrorMessage["requestBodyInvalid"],
+                str(error_obj),
+            )
+    raise WarningError(
+        ErrorCode.ExecutionError,
+        ErrorMessage.ExecutionErrorMessage["executionFailed"],
+        "run status failed",
+    )
+
+
+def _check_alias(name: str, with_details: bool = False) -> Any:
+    from morph.task.utils.run_backend.errors import MorphFunctionLoadError
+    from morph.task.utils.run_backend.state import MorphGlobalContext
 
-def run_file_with_type_service(
-    input: RunFileWithTypeService,
-) -> RunFileWithTypeResponse:
     project_root = find_project_root_dir()
     context = MorphGlobalContext.get_instance()
 
-    errors = context.partial_load(
-        project_root,
-        input.name,
-    )
+    errors = _partial_load(context, project_root, name)
     if len(errors) > 0:
         logger.error(MorphFunctionLoadError.format_errors(errors))
+        message = f"Alias not found {name}. Check the console for more detailed error information."
+        if with_details:
+            error_details = "".join([e.error for e in errors])
+            message = f"{message} details: {error_details}"
         raise WarningError(
             ErrorCode.FileError,
             ErrorMessage.FileErrorMessage["notFound"],
-            f"Alias not found {input.name}. Check the console for more detailed error information.",
+            message,
         )
-    resource = context.search_meta_object_by_name(input.name)
-    if resource is None:
+    return context
+
+
+def _prepare_run_task(
+    name: str,
+    variables: Optional[Dict[str, Any]],
+    use_cache: bool = False,
+    run_id: Optional[str] = None,
+    mode: Literal["cli", "api"] = "api",
+) -> Any:
+    from morph.cli.flags import Flags
+    from morph.task.run import RunTask
+
+    flags = Flags.from_params(
+        {
+            "FILENAME": name,
+            "RUN_ID": run_id if run_id else f"{int(time.time() * 1000)}",
+            "DAG": use_cache,
+            "DATA": convert_variables_values(variables),
+        }
+    )
+    try:
+        return RunTask(flags, mode)
+    except ValueError as e:
+        # RunTask reports load errors of the alias as a ValueError in api mode
+        _PARTIAL_LOAD_SIGNATURES.pop((find_project_root_dir(), name), None)
+        logger.error(str(e))
         raise WarningError(
             ErrorCode.FileError,
             ErrorMessage.FileErrorMessage["notFound"],
-            f"Alias not found {input.name}. Check the console for more detailed error information.",
+            f"Alias not found {name}. Check the console for more detailed error information.",
         )
 
-    set_command_args()
-    with click.Context(click.Command(name="")) as ctx:
-        ctx.params["FILENAME"] = input.name
-        ctx.params["RUN_ID"] = f"{int(time.time() * 1000)}"
-        ctx.params["DAG"] = input.use_cache if input.use_cache else False
-        ctx.params["DATA"] = convert_variables_values(input.variables)
-        task = RunTask(Flags(ctx), "api")
+
+def _run_task(task: Any) -> Any:
+    from morph.task.utils.run_backend.types import RunStatus
 
     try:
         result = task.run()
@@ -81,26 +172,33 @@ def run_file_with_type_service(
         )
 
     if task.final_state != RunStatus.DONE.value:
-        if task.error is not None:
-            try:
-                error = json.loads(task.error)
-            except Exception:  # noqa
-                raise WarningError(
-                    ErrorCode.ExecutionError,
-                    ErrorMessage.ExecutionErrorMessage["executionFailed"],
-                    "run status failed",
-                )
-            if "RequestError" in error:
-                raise RequestError(
-                    ErrorCode.RequestError,
-                    ErrorMessage.RequestErrorMessage["requestBodyInvalid"],
-                    str(error),
-                )
+        _raise_run_error(task.error)
+    return result
+
+
+def _run_alias(
+    name: str,
+    variables: Optional[Dict[str, Any]],
+    use_cache: bool = False,
+    run_id: Optional[str] = None,
+) -> Any:
+    context = _check_alias(name)
+    if context.search_meta_object_by_name(name) is None:
         raise WarningError(
-            ErrorCode.ExecutionError,
-            ErrorMessage.ExecutionErrorMessage["executionFailed"],
+            ErrorCode.FileError,
+            ErrorMessage.FileErrorMessage["notFound"],
+            f"Alias not found {name}. Check the console for more detailed error information.",
         )
 
+    task = _prepare_run_task(name, variables, use_cache=use_cache, run_id=run_id)
+    return _run_task(task)
+
+
+def run_file_with_type_service(
+    input: RunFileWithTypeService,
+) -> RunFileWithTypeResponse:
+    result = _run_alias(input.name, input.variables, use_cache=bool(input.use_cache))
+
     try:
         data = convert_file_output(input.type, result, input.limit, input.skip)
     except Exception:  # noqa
@@ -117,148 +215,69 @@ def run_file_with_type_service(
 
 
 def run_file_service(input: RunFileService) -> SuccessResponse:
-    project_root = find_project_root_dir()
-    context = MorphGlobalContext.get_instance()
+    _run_alias(input.name, input.variables, run_id=input.run_id)
+    return SuccessResponse(message="ok")
 
-    errors = context.partial_load(
-        project_root,
-        input.name,
-    )
-    if len(errors) > 0:
-        logger.error(MorphFunctionLoadError.format_errors(errors))
-        raise WarningError(
-            ErrorCode.FileError,
-            ErrorMessage.FileErrorMessage["notFound"],
-            f"Alias not found {input.name}. Check the console for more detailed error information.",
-        )
-    resource = context.search_meta_object_by_name(input.name)
-    if resource is None:
-        raise WarningError(
-            ErrorCode.FileError,
-            ErrorMessage.FileErrorMessage["notFound"],
-            f"Alias not found {input.name}. Check the console for more detailed error information.",
-        )
 
-    set_command_args()
-    with click.Context(click.Command(name="")) as ctx:
-        run_id = input.run_id if input.run_id else f"{int(time.time() * 1000)}"
-        ctx.params["FILENAME"] = input.name
-        ctx.params["RUN_ID"] = run_id
-        ctx.params["DAG"] = False
-        ctx.params["DATA"] = convert_variables_values(input.variables)
-        task = RunTask(Flags(ctx), "api")
+async def run_file_stream_service(input: RunFileStreamService) -> Any:
+    _check_alias(input.name, with_details=True)
 
     try:
-        task.run()
+        task = _prepare_run_task(input.name, input.variables)
+        # aliases may also return a list or a DataFrame instead of a generator
+        generator = iter(task.run())
     except Exception as e:
-        raise WarningError(
-            ErrorCode.ExecutionError,
-            ErrorMessage.ExecutionErrorMessage["executionFailed"],
-            str(e),
-        )
-
-    if task.final_state != RunStatus.DONE.value:
-        if task.error is not None:
-            try:
-                error = json.loads(task.error)
-            except Exception:  # noqa
-                raise WarningError(
-                    ErrorCode.ExecutionError,
-                    ErrorMessage.ExecutionErrorMessage["executionFailed"],
-                    "run status failed",
-                )
-            if "RequestError" in error:
-                raise RequestError(
-                    ErrorCode.RequestError,
-                    ErrorMessage.RequestErrorMessage["requestBodyInvalid"],
-                    str(error),
-                )
-        raise WarningError(
-            ErrorCode.ExecutionError,
-            ErrorMessage.ExecutionErrorMessage["executionFailed"],
-        )
-
-    return SuccessResponse(message="ok")
-
+        error_detail = {
+            "type": type(e).__name__,
+            "message": str(e),
+        }
+        error_json = json.dumps(error_detail, ensure_ascii=False)
+        raise Exception(error_json)
+
+    first_chunk = True
+    try:
+        while True:
+            # advance the generator in a worker thread so that producing a
+            # chunk does not block the event loop
+            c = await asyncio.to_thread(next, generator, _STREAM_END)
+            if c is _STREAM_END:
+                break
+            if first_chunk:
+                first_chunk = False
+                yield '{"chunks": ['
+            yield cast(str, c) + ","
+
+        yield "]}"
+    except Exception as e:
+        error_detail = {
+            "type": type(e).__name__,
+            "message": str(e),
+        }
+        error_json = json.dumps(error_detail, ensure_ascii=False)
+        raise Exception(error_json)
 
-async def run_file_stream_service(input: RunFileStreamService) -> Any:
-    project_root = find_project_root_dir()
-    context = MorphGlobalContext.get_instance()
 
-    errors = context.partial_load(
-        project_root,
-        input.name,
-    )
-    if len(errors) > 0:
-        logger.error(MorphFunctionLoadError.format_errors(errors))
-        error_details = "".join([e.error for e in errors])
-        raise WarningError(
-            ErrorCode.FileError,
-            ErrorMessage.FileErrorMessage["notFound"],
-            f"Alias not found {input.name}. Check the console for more detailed error information. details: {error_details}",
-        )
+def list_resource_service() -> Any:
+    from morph.cli.flags import Flags
+    from morph.task.resource import PrintResourceTask
 
-    set_command_args()
-    with click.Context(click.Command(name="")) as ctx:
-        ctx.params.update(
-            {
-                "FILENAME": input.name,
-                "RUN_ID": f"{int(time.time() * 1000)}",
-                "DAG": False,
-                "DATA": convert_variables_values(input.variables),
-            }
-        )
+    task = PrintResourceTask(Flags.from_params({"ALL": True}))
+    return task.collect()
 
-        try:
-            task = RunTask(Flags(ctx), "api")
-            generator = task.run()
-        except Exception as e:
-            error_detail = {
-                "type": type(e).__name__,
-                "message": str(e),
-            }
-            error_json = json.dumps(error_detail, ensure_ascii=False)
-            raise Exception(error_json)
-
-        first_chunk = True
-        try:
-            for c in generator:
-                if first_chunk:
-                    first_chunk = False
-                    yield '{"chunks": ['
-                    await asyncio.sleep(0)
-                yield c + ","
-                await asyncio.sleep(0)
-
-            yield "]}"
-        except Exception as e:
-            error_detail = {
-                "type": type(e).__name__,
-                "message": str(e),
-            }
-            error_json = json.dumps(error_detail, ensure_ascii=False)
-            raise Exception(error_json)
 
+def _save_upload_file(src: BinaryIO, path: str) -> None:
+    # copy in fixed size chunks so large uploads are never fully held in memory
+    src.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(src, f, 1024 * 1024)
 
-def list_resource_service() -> Any:
-    set_command_args()
-    with click.Context(click.Command(name="")) as ctx:
-        ctx.params["ALL"] = True
-        task = PrintResourceTask(Flags(ctx))
-
-        output = io.StringIO()
-        with redirect_stdout(output):
-            task.run()
 
-        result = output.getvalue()
-        try:
-            return json.loads(result)
-        except json.JSONDecodeError:  # noqa
-            raise WarningError(
-                ErrorCode.FileError,
-                ErrorMessage.FileErrorMessage["notFound"],
-                result,
-            )
+def _read_file(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
 
 
 async def file_upload_service(input: UploadFileService) -> Any:
@@ -271,9 +290,7 @@ async def file_upload_service(input: UploadFileService) -> Any:
 
         # Save the uploaded file to the temporary directory
         temp_file_path = os.path.join(temp_dir, input.file.filename)
-        with open(temp_file_path, "wb") as temp_file:
-            content = await input.file.read()
-            temp_file.write(content)
+        await asyncio.to_thread(_save_upload_file, input.file.file, temp_file_path)
 
         # Intercept the file upload by running the file_upload python function
         run_file_service(
@@ -283,19 +300,11 @@ async def file_upload_service(input: UploadFileService) -> Any:
         )
 
         # Read the saved file path from the cache (always created as following path)
-        saved_filepath = ""
         cache_file = "/tmp/file_upload.cache"
-        if os.path.exists(cache_file):
-            with open(cache_file, "r") as f:
-                saved_filepath = f.read()
+        saved_filepath = await asyncio.to_thread(_read_file, cache_file)
 
         # Remove the temporary directory
-        if os.path.exists(temp_dir):
-            for file in os.listdir(temp_dir):
-                file_path = os.path.join(temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            os.rmdir(temp_dir)
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
 
         # Return the saved file path
         return JSONResponse(
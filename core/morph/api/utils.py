@@ -1,5 +1,4 @@
 import json
-import sys
 from typing import Any, Dict, Literal, Optional, Union
 
 import pandas as pd
@@ -65,8 +64,3 @@ def convert_variables_values(variables: Optional[Dict[str, Any]]) -> Dict[str, A
                 pass
         variables_[k] = v
     return variables_
-
-
-def set_command_args():
-    if len(sys.argv) < 2:
-        sys.argv = ["", "serve"]
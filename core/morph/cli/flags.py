@@ -1,3 +1,4 @@
+import functools
 import importlib.metadata
 import os
 import sys
@@ -275,6 +276,19 @@ class Flags:
         flags.fire_deprecations()
         return flags
 
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "Flags":
+        """Build flags from a plain dict of params without a click context.
+        Meant for callers outside of the CLI (e.g. the API server) that already know the params.
+        """
+        flags = cls.__new__(cls)
+        for key, value in FLAGS_DEFAULTS.items():
+            object.__setattr__(flags, key, value)
+        for key, value in params.items():
+            object.__setattr__(flags, key.upper(), value)
+        object.__setattr__(flags, "deprecated_env_var_warnings", [])
+        return flags
+
     # This is here to prevent mypy from complaining about all of the
     # attributes which we added dynamically.
     def __getattr__(self, name: str) -> Any:
@@ -367,13 +381,9 @@ def command_args(command: CliCommand) -> ArgsList:
 
     e.g. fn("run") -> ["defer", "favor_state", "exclude", ...]
     """
-    import morph.cli.main as cli
+    from morph.cli.main import cli  # type: ignore
 
-    CMD_DICT: Dict[CliCommand, ClickCommand] = {
-        CliCommand.INIT: cli.init,  # type: ignore
-        CliCommand.RUN: cli.run,  # type: ignore
-    }
-    click_cmd: Optional[ClickCommand] = CMD_DICT.get(command, None)
+    click_cmd: Optional[ClickCommand] = cli.get_command(None, command.value)
     if click_cmd is None:
         raise Exception(f"No command found for name '{command.name}'")
     return format_params(click_cmd.params)
@@ -385,6 +395,15 @@ def format_params(params: List[Parameter]) -> ArgsList:
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def get_current_version() -> Optional[str]:
+    """Retrieve the installed morph-data version, or None when it is not installed."""
+    try:
+        return importlib.metadata.version("morph-data")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
 def get_latest_version() -> Optional[str]:
     """Retrieve the latest morph-data version from PyPI."""
     try:
@@ -407,7 +426,10 @@ def check_version_warning():
     """Check if the current version is outdated and display a warning if necessary."""
     try:
         # Get the current version of morph-data
-        current_version_str = importlib.metadata.version("morph-data")
+        current_version_str = get_current_version()
+        if current_version_str is None:
+            click.echo(click.style("Warning: morph-data is not installed.", fg="red"))
+            return
         try:
             current_version = Version(current_version_str)
         except InvalidVersion:
@@ -444,7 +466,5 @@ def check_version_warning():
                     )
                 )
                 click.echo()
-    except importlib.metadata.PackageNotFoundError:
-        click.echo(click.style("Warning: morph-data is not installed.", fg="red"))
     except Exception as e:
         click.echo(click.style(f"Warning: Failed to check version: {e}", fg="yellow"))
@@ -2,39 +2,56 @@
 
 from __future__ import annotations
 
-import functools
-from typing import Callable, Dict, Optional, Tuple, Union
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import click
+# answer `morph --version` before click and the command modules are loaded
+if os.path.basename(sys.argv[0]) == "morph" and sys.argv[1:2] == ["--version"]:
+    import importlib.metadata
 
-from morph.cli import params, requires
-from morph.cli.flags import check_version_warning
+    try:
+        print(f"morph-data CLI version: {importlib.metadata.version('morph-data')}")
+        sys.exit(0)
+    except importlib.metadata.PackageNotFoundError:
+        # let click's version option report the missing distribution
+        pass
 
+import click  # noqa: E402
+
+
+def global_flags(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Attach the options shared by the group and every subcommand."""
+    from morph.cli import params
+
+    return params.log_format(func)
 
-def global_flags(
-    func: Callable[..., Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]]
-) -> Callable[..., Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]]:
-    @params.log_format
-    @functools.wraps(func)
-    def wrapper(
-        *args: Tuple[Union[Dict[str, Union[str, int, bool]], None], bool],
-        **kwargs: Dict[str, Union[str, int, bool]],
-    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-        ctx = click.get_current_context()
 
-        if ctx.info_name == "serve":
-            # Warn about version before running the command
-            check_version_warning()
-        else:
-            # Warn about version after running the command
-            ctx.call_on_close(check_version_warning)
+class _LazyGroup(click.Group):
+    """Click group that only builds the subcommand that is actually invoked."""
 
-        return func(*args, **kwargs)
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(_SUBCOMMANDS)
 
-    return wrapper
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands:
+            factory = _SUBCOMMANDS.get(cmd_name)
+            if factory is None:
+                return None
+            self.add_command(factory(), cmd_name)
+        return self.commands[cmd_name]
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # list commands from a static table so that --help does not build every command
+        rows = [(name, _COMMAND_HELP[name]) for name in self.list_commands(ctx)]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 
 @click.group(
+    cls=_LazyGroup,
     context_settings={"help_option_names": ["-h", "--help"]},
     invoke_without_command=True,
     no_args_is_help=True,
@@ -51,186 +68,234 @@ def cli(ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]) -> None:
     """A data analysis tool for transformations, visualization by using SQL and Python.
     For more information on these commands, visit: docs.morph-data.io
     """
+    from morph.cli.flags import check_version_warning
+
+    if ctx.invoked_subcommand == "serve":
+        # Warn about version before running the command
+        check_version_warning()
+    else:
+        # Warn about version after running the command
+        ctx.call_on_close(check_version_warning)
+
+
+def _mk_command(
+    name: str,
+    callback: Callable[..., Any],
+    options: Optional[List[Callable[..., Any]]] = None,
+) -> click.Command:
+    """Build a subcommand with the context, flags and pre/postflight handling
+    shared by every morph command. `options` are click option/argument
+    decorators, listed in the order they should appear in the help."""
+    from morph.cli import requires
+
+    func = click.pass_context(
+        global_flags(requires.preflight(requires.postflight(callback)))
+    )
+    for option in reversed(options or []):
+        func = option(func)
+    return click.command(name, help=_COMMAND_HELP[name])(func)
+
+
+def _make_config() -> click.Command:
+    from morph.cli import params
+
+    def config(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
+        from morph.task.config import ConfigTask
 
+        task = ConfigTask(ctx.obj["flags"])
+        results = task.run()
+        return results, True
 
-@cli.command("config")
-@params.profile
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def config(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-    """Configure morph credentials to run project."""
-    from morph.task.config import ConfigTask
-
-    task = ConfigTask(ctx.obj["flags"])
-    results = task.run()
-    return results, True
-
-
-@cli.command("new")
-@click.argument("directory_name", required=False)
-@params.project_id
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def new(
-    ctx: click.Context,
-    directory_name: Optional[str],
-    **kwargs: Dict[str, Union[str, int, bool]],
-) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-    """Create a new morph project."""
-    from morph.task.new import NewTask
-
-    task = NewTask(ctx.obj["flags"], directory_name)
-    results = task.run()
-    return results, True
-
-
-@cli.command("compile")
-@click.option("--force", "-f", is_flag=True, help="Force compile.")
-@click.pass_context
-@global_flags
-@params.verbose
-@requires.preflight
-@requires.postflight
-def compile(
-    ctx: click.Context, force: bool, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[None, bool]:
-    """Analyse morph functions into indexable objects."""
-    from morph.task.compile import CompileTask
-
-    task = CompileTask(ctx.obj["flags"], force=force)
-    task.run()
-    return None, True
-
-
-@cli.command("run")
-@click.argument("filename", required=True)
-@click.pass_context
-@global_flags
-@params.data
-@params.run_id
-@params.dag
-@requires.preflight
-@requires.postflight
-def run(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-    """Run sql and python file and bring the results in output file."""
-    from morph.task.run import RunTask
-
-    task = RunTask(ctx.obj["flags"])
-    results = task.run()
-
-    return results, True
-
-
-@cli.command("clean")
-@params.verbose
-@params.force
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def clean(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[None, bool]:
-    """Clean all the cache and garbage in Morph project."""
-    from morph.task.clean import CleanTask
+    return _mk_command("config", config, [params.profile])
 
-    task = CleanTask(ctx.obj["flags"])
-    task.run()
 
-    return None, True
+def _make_new() -> click.Command:
+    from morph.cli import params
 
+    def new(
+        ctx: click.Context,
+        directory_name: Optional[str],
+        **kwargs: Dict[str, Union[str, int, bool]],
+    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
+        from morph.task.new import NewTask
 
-@cli.command("deploy")
-@params.no_cache
-@params.verbose
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def deploy(
-    ctx: click.Context, no_cache: bool, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-    """Deploy morph project to the cloud."""
-    from morph.task.deploy import DeployTask
+        task = NewTask(ctx.obj["flags"], directory_name)
+        results = task.run()
+        return results, True
 
-    task = DeployTask(ctx.obj["flags"])
-    results = task.run()
-    return results, True
+    return _mk_command(
+        "new",
+        new,
+        [click.argument("directory_name", required=False), params.project_id],
+    )
 
 
-@cli.command("serve")
-@params.workdir
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def serve(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[None, bool]:
-    """Launch API server."""
-    from morph.task.api import ApiTask
+def _make_compile() -> click.Command:
+    from morph.cli import params
 
-    task = ApiTask(ctx.obj["flags"])
-    task.run()
+    def compile(
+        ctx: click.Context, force: bool, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[None, bool]:
+        from morph.task.compile import CompileTask
 
-    return None, True
+        task = CompileTask(ctx.obj["flags"], force=force)
+        task.run()
+        return None, True
 
+    return _mk_command(
+        "compile",
+        compile,
+        [
+            click.option("--force", "-f", is_flag=True, help="Force compile."),
+            params.verbose,
+        ],
+    )
 
-@cli.command("init")
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def init(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
-    """Initialize morph connection setting to run project."""
-    from morph.task.init import InitTask
 
-    task = InitTask(ctx.obj["flags"])
-    results = task.run()
-    return results, True
+def _make_run() -> click.Command:
+    from morph.cli import params
 
+    def run(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
+        from morph.task.run import RunTask
 
-@cli.command("context")
-@params.output
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def context(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[None, bool]:
-    """Print or save the user information context."""
-    from morph.task.context import ContextTask
+        task = RunTask(ctx.obj["flags"])
+        results = task.run()
 
-    task = ContextTask(ctx.obj["flags"])
-    task.run()
+        return results, True
 
-    return None, True
+    return _mk_command(
+        "run",
+        run,
+        [
+            click.argument("filename", required=True),
+            params.data,
+            params.run_id,
+            params.dag,
+        ],
+    )
 
 
-@cli.command("add")
-@click.argument("plugin_name", required=True)
-@click.pass_context
-@global_flags
-@requires.preflight
-@requires.postflight
-def add_plugin(
-    ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
-) -> Tuple[None, bool]:
-    """Add a plugin to your project."""
-    from morph.task.plugin import PluginTask
-
-    task = PluginTask(ctx.obj["flags"])
-    task.run()
-
-    return None, True
+def _make_clean() -> click.Command:
+    from morph.cli import params
+
+    def clean(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[None, bool]:
+        from morph.task.clean import CleanTask
+
+        task = CleanTask(ctx.obj["flags"])
+        task.run()
+
+        return None, True
+
+    return _mk_command("clean", clean, [params.verbose, params.force])
+
+
+def _make_deploy() -> click.Command:
+    from morph.cli import params
+
+    def deploy(
+        ctx: click.Context, no_cache: bool, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
+        from morph.task.deploy import DeployTask
+
+        task = DeployTask(ctx.obj["flags"])
+        results = task.run()
+        return results, True
+
+    return _mk_command(
+        "deploy", deploy, [params.no_cache, params.cache_from, params.verbose]
+    )
+
+
+def _make_serve() -> click.Command:
+    from morph.cli import params
+
+    def serve(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[None, bool]:
+        from morph.task.api import ApiTask
+
+        task = ApiTask(ctx.obj["flags"])
+        task.run()
+
+        return None, True
+
+    return _mk_command("serve", serve, [params.workdir])
+
+
+def _make_init() -> click.Command:
+    def init(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[Union[Dict[str, Union[str, int, bool]], None], bool]:
+        from morph.task.init import InitTask
+
+        task = InitTask(ctx.obj["flags"])
+        results = task.run()
+        return results, True
+
+    return _mk_command("init", init)
+
+
+def _make_context() -> click.Command:
+    from morph.cli import params
+
+    def context(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[None, bool]:
+        from morph.task.context import ContextTask
+
+        task = ContextTask(ctx.obj["flags"])
+        task.run()
+
+        return None, True
+
+    return _mk_command("context", context, [params.output])
+
+
+def _make_add() -> click.Command:
+    def add_plugin(
+        ctx: click.Context, **kwargs: Dict[str, Union[str, int, bool]]
+    ) -> Tuple[None, bool]:
+        from morph.task.plugin import PluginTask
+
+        task = PluginTask(ctx.obj["flags"])
+        task.run()
+
+        return None, True
+
+    return _mk_command(
+        "add", add_plugin, [click.argument("plugin_name", required=True)]
+    )
+
+
+_SUBCOMMANDS: Dict[str, Callable[[], click.Command]] = {
+    "config": _make_config,
+    "new": _make_new,
+    "compile": _make_compile,
+    "run": _make_run,
+    "clean": _make_clean,
+    "deploy": _make_deploy,
+    "serve": _make_serve,
+    "init": _make_init,
+    "context": _make_context,
+    "add": _make_add,
+}
+
+# help text of every subcommand, also listed by `morph --help` without building them
+_COMMAND_HELP: Dict[str, str] = {
+    "config": "Configure morph credentials to run project.",
+    "new": "Create a new morph project.",
+    "compile": "Analyse morph functions into indexable objects.",
+    "run": "Run sql and python file and bring the results in output file.",
+    "clean": "Clean all the cache and garbage in Morph project.",
+    "deploy": "Deploy morph project to the cloud.",
+    "serve": "Launch API server.",
+    "init": "Initialize morph connection setting to run project.",
+    "context": "Print or save the user information context.",
+    "add": "Add a plugin to your project.",
+}
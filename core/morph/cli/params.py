@@ -132,6 +132,12 @@ no_cache = click.option(
     help="Disable cache.",
 )
 
+cache_from = click.option(
+    "--cache-from",
+    type=str,
+    help="Specify an image or cache reference to reuse build layers from.",
+)
+
 output = click.option(
     "--output",
     "-o",
@@ -1,17 +1,22 @@
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 from pydantic import BaseModel, Field
 
 from morph.constants import MorphConstant
-from morph.task.utils.connection import (
-    CONNECTION_TYPE,
-    MORPH_DUCKDB_CONNECTION_SLUG,
-    MorphConnection,
-)
 from morph.task.utils.morph import find_project_root_dir
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+# same value as morph.task.utils.connection.MORPH_DUCKDB_CONNECTION_SLUG, kept here so
+# that defining MorphProject does not import the connection module
+_DUCKDB_CONNECTION_SLUG = "DUCKDB"
+
 
 class BuildConfig(BaseModel):
     runtime: Optional[str] = None
@@ -30,7 +35,7 @@ class DeploymentConfig(BaseModel):
 class MorphProject(BaseModel):
     profile: Optional[str] = "default"
     source_paths: List[str] = Field(default_factory=lambda: ["src"])
-    default_connection: Optional[str] = MORPH_DUCKDB_CONNECTION_SLUG
+    default_connection: Optional[str] = _DUCKDB_CONNECTION_SLUG
     project_id: Optional[str] = Field(default=None)
     package_manager: str = Field(
         default="pip", description="Package manager to use, e.g., pip or poetry."
@@ -53,22 +58,51 @@ def default_initial_project() -> MorphProject:
     return MorphProject()
 
 
+def _list_file_names(project_root: str) -> Set[str]:
+    # a single directory read instead of one stat per candidate file
+    try:
+        with os.scandir(project_root) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def load_project(project_root: str) -> Optional[MorphProject]:
-    config_path = os.path.join(project_root, "morph_project.yml")
-    old_config_path = os.path.join(project_root, "morph_project.yaml")
-    if not os.path.exists(config_path) and not os.path.exists(old_config_path):
+    names = _list_file_names(project_root)
+    if "morph_project.yml" in names:
+        config_path = os.path.join(project_root, "morph_project.yml")
+    elif "morph_project.yaml" in names:
+        config_path = os.path.join(project_root, "morph_project.yaml")
+    else:
         return None
-    elif not os.path.exists(config_path):
-        config_path = old_config_path
 
+    # parsed projects are reused until the file changes; callers get their own copy.
+    # the size is part of the key since two writes can share an mtime
+    stat = os.stat(config_path)
+    project = _load_project_file(config_path, stat.st_mtime_ns, stat.st_size)
+    if project is None:
+        save_project(project_root, default_initial_project())
+        return default_initial_project()
+    return project.model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_project_file(
+    config_path: str, mtime_ns: int, size: int
+) -> Optional[MorphProject]:
     with open(config_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     if data is None:
-        save_project(project_root, default_initial_project())
-        return default_initial_project()
+        return None
 
     if "default_connection" in data and isinstance(data["default_connection"], dict):
+        from morph.task.utils.connection import (
+            CONNECTION_TYPE,
+            MORPH_DUCKDB_CONNECTION_SLUG,
+            MorphConnection,
+        )
+
         connection_data = data["default_connection"]
         connection_type = connection_data.get("type")
 
@@ -85,8 +119,8 @@ def load_project(project_root: str) -> Optional[MorphProject]:
 
 
 def save_project(project_root: str, project: MorphProject) -> None:
-    old_config_path = os.path.join(project_root, "morph_project.yaml")
-    if os.path.exists(old_config_path):
+    if "morph_project.yaml" in _list_file_names(project_root):
+        old_config_path = os.path.join(project_root, "morph_project.yaml")
         with open(old_config_path, "w") as f:
             f.write(dump_project_yaml(project))
         return
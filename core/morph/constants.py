@@ -1,10 +1,20 @@
 import os
 
 
+class _UserPath:
+    """Path under the user's home directory, expanded when it is read."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __get__(self, instance: object, owner: type) -> str:
+        return os.path.expanduser(self.path)
+
+
 class MorphConstant:
     """Directories"""
 
-    INIT_DIR = os.path.expanduser("~/.morph")
+    INIT_DIR = _UserPath("~/.morph")
     TMP_MORPH_DIR = "/tmp/morph"
     PLUGIN_DIR = "src/plugin"
 
@@ -13,8 +23,9 @@ class MorphConstant:
         return os.path.join(project_root, ".morph", "frontend")
 
     """ Files """
-    MORPH_CRED_PATH = os.path.expanduser("~/.morph/credentials")
-    MORPH_CONNECTION_PATH = os.path.expanduser("~/.morph/connections.yml")
+    MORPH_CRED_PATH = _UserPath("~/.morph/credentials")
+    MORPH_CONNECTION_PATH = _UserPath("~/.morph/connections.yml")
+    MORPH_DOCKER_PROBE_PATH = _UserPath("~/.morph/docker_ok")
 
     """ Others """
-    EXECUTABLE_EXTENSIONS = [".sql", ".py"]
+    EXECUTABLE_EXTENSIONS = frozenset({".sql", ".py"})
@@ -1,17 +1,56 @@
+import hashlib
 import os
-import signal
-import socket
-import subprocess
+import re
 import sys
-import threading
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import click
-from dotenv import dotenv_values, load_dotenv
+
 from morph.cli.flags import Flags
 from morph.task.base import BaseTask
-from morph.task.utils.morph import find_project_root_dir
+from morph.task.utils.morph import (
+    clear_project_root_dir_cache,
+    find_project_root_dir,
+    load_dotenv_values,
+)
+
+if TYPE_CHECKING:
+    import selectors
+    import subprocess
+
+# log level -> color, in the order of precedence when a line has several levels
+_LOG_LEVEL_COLORS = {
+    "ERROR": "red",
+    "WARNING": "yellow",
+    "DEBUG": "blue",
+    "INFO": "green",
+}
+_LOG_LEVEL_RE = re.compile("|".join(_LOG_LEVEL_COLORS))
+# escape sequences are built once instead of styling every line with click
+_ANSI_COLOR_PREFIXES = {
+    color: click.style("", fg=color, reset=False)
+    for color in list(_LOG_LEVEL_COLORS.values()) + ["white"]
+}
+_ANSI_RESET = "\x1b[0m"
+
+_SERVER_SCRIPT_PATH = str(Path(__file__).resolve().parent / "server.py")
+
+# written into node_modules after a successful install, so removing node_modules
+# also invalidates it
+_NPM_STAMP_FILE = ".morph-install-stamp"
+
+
+def _get_color_for_log_level(line: str) -> str:
+    levels = _LOG_LEVEL_RE.findall(line)
+    if not levels:
+        return "white"
+    if len(levels) == 1:
+        return _LOG_LEVEL_COLORS[levels[0]]
+    for level, color in _LOG_LEVEL_COLORS.items():
+        if level in levels:
+            return color
+    return "white"
 
 
 class ApiTask(BaseTask):
@@ -29,6 +68,8 @@ class ApiTask(BaseTask):
         self.workdir = args.WORKDIR
         if self.workdir:
             os.chdir(self.workdir)
+            # the project layout may have changed since the root was last looked up
+            clear_project_root_dir_cache()
         else:
             self.workdir = os.getcwd()
 
@@ -37,36 +78,44 @@ class ApiTask(BaseTask):
         # load environment variables from .env file
         self.project_root = find_project_root_dir()
         dotenv_path = os.path.join(self.project_root, ".env")
-        load_dotenv(dotenv_path)
-        env_vars = dotenv_values(dotenv_path)
-        for e_key, e_val in env_vars.items():
-            os.environ[e_key] = str(e_val)
+        os.environ.update(load_dotenv_values(dotenv_path))
 
         # for managing subprocesses
-        self.processes: List[subprocess.Popen[str]] = []
+        self.processes: List["subprocess.Popen[bytes]"] = []
+        self._selector: Optional["selectors.BaseSelector"] = None
+        # child output is only colored when it goes to a terminal
+        self._use_color = sys.stdout.isatty()
 
-    def _find_available_port(self, start_port: int, max_port: int = 65535) -> int:
-        port = start_port
+    def _find_available_port(self, start_port: int) -> int:
+        import socket
 
-        while port <= max_port:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                if s.connect_ex(("0.0.0.0", port)) != 0:
-                    return port
-            port += 1
+        # a bind probe can succeed next to a listener on a specific address (e.g. with
+        # SO_REUSEADDR on macOS/BSD), so check the preferred port by connecting to it
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(("127.0.0.1", start_port)) != 0:
+                return start_port
+
+        # otherwise let the OS pick a free ephemeral port
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind(("0.0.0.0", 0))
+                return int(s.getsockname()[1])
+            except OSError:
+                pass
 
         click.echo(
             click.style(
-                f"Error: No available port found in range {start_port}-{max_port}.",
+                f"Error: No available port found (preferred port {start_port}).",
                 fg="red",
             )
         )
         sys.exit(1)
 
     def run(self):
-        current_dir = Path(__file__).resolve().parent
-        server_script_path = os.path.join(current_dir, "server.py")
+        import signal
 
         signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
         try:
             click.echo(
                 click.style(
@@ -80,7 +129,7 @@ class ApiTask(BaseTask):
 
             # run server process
             self._run_process(
-                [sys.executable, server_script_path]
+                [sys.executable, _SERVER_SCRIPT_PATH]
                 + sys.argv[1:]
                 + ["--port", str(self.server_port)],
             )
@@ -99,29 +148,72 @@ class ApiTask(BaseTask):
                     fg="yellow",
                 )
             )
-            if hasattr(signal, "pause"):
-                signal.pause()
-            else:
-                import time
-
-                while True:
-                    time.sleep(1)
+            self._wait_for_child_exit()
         except KeyboardInterrupt:
             self._signal_handler(None, None)
 
+    def _wait_for_child_exit(self) -> None:
+        import threading
+
+        exited = threading.Event()
+
+        def _watch(process: Any) -> None:
+            process.wait()
+            exited.set()
+
+        for process in self.processes:
+            threading.Thread(target=_watch, args=(process,), daemon=True).start()
+
+        # the timeout keeps the main thread responsive to signals on every platform
+        while not exited.wait(timeout=1):
+            pass
+
+        stopped = next(p for p in self.processes if p.poll() is not None)
+        click.echo(
+            click.style(
+                f"A server process exited unexpectedly (exit code {stopped.returncode}). Shutting down...",
+                fg="red",
+            ),
+            err=True,
+        )
+        self._terminate_processes()
+        sys.exit(1)
+
     def _run_frontend(self) -> None:
+        import subprocess
+
+        stamp = self._npm_install_stamp()
+        stamp_path = os.path.join(self.project_root, "node_modules", _NPM_STAMP_FILE)
         try:
-            subprocess.run(
-                "npm install",
-                cwd=self.project_root,
-                shell=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError:
-            click.echo(
-                click.style("Failed to install frontend dependencies.", fg="yellow")
-            )
-            exit(1)
+            with open(stamp_path, "r") as f:
+                installed = f.read() == stamp
+        except OSError:
+            installed = False
+
+        if not installed:
+            command = [
+                "npm",
+                "install",
+                "--prefer-offline",
+                "--no-audit",
+                "--fund=false",
+            ]
+            if sys.platform == "win32":
+                command = ["cmd.exe", "/c"] + command
+            try:
+                subprocess.run(command, cwd=self.project_root, check=True)
+            except subprocess.CalledProcessError:
+                click.echo(
+                    click.style("Failed to install frontend dependencies.", fg="yellow")
+                )
+                exit(1)
+            try:
+                # npm install may have rewritten package-lock.json
+                os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+                with open(stamp_path, "w") as f:
+                    f.write(self._npm_install_stamp())
+            except OSError:
+                pass
 
         self._run_process(
             ["npm", "run", "dev", "--", "--port", f"{self.front_port}"],
@@ -129,19 +221,32 @@ class ApiTask(BaseTask):
             is_debug=True,
         )
 
+    def _npm_install_stamp(self) -> str:
+        # dependencies only need to be reinstalled when the manifests change
+        hash_func = hashlib.sha256()
+        for file_name in ["package.json", "package-lock.json"]:
+            try:
+                with open(os.path.join(self.project_root, file_name), "rb") as f:
+                    hash_func.update(f.read())
+            except FileNotFoundError:
+                pass
+            hash_func.update(b"\0")
+        return hash_func.hexdigest()
+
     def _run_process(
         self,
         command: List[str],
         cwd: Optional[str] = None,
         is_debug: Optional[bool] = True,
     ) -> None:
+        import subprocess
+
         if sys.platform == "win32":
             process = subprocess.Popen(
                 ["cmd.exe", "/c"] + command,
                 cwd=cwd,
                 stdout=subprocess.PIPE if is_debug else subprocess.DEVNULL,
                 stderr=subprocess.PIPE if is_debug else subprocess.DEVNULL,
-                text=True,
             )
         else:
             process = subprocess.Popen(
@@ -149,44 +254,89 @@ class ApiTask(BaseTask):
                 cwd=cwd,
                 stdout=subprocess.PIPE if is_debug else subprocess.DEVNULL,
                 stderr=subprocess.PIPE if is_debug else subprocess.DEVNULL,
-                text=True,
+                # own process group so that npm/vite grandchildren are stopped too
+                start_new_session=True,
             )
 
-        def log_output(pipe):
-            for line in iter(pipe.readline, ""):
-                color = _get_color_for_log_level(line)
-                for sub_line in line.splitlines():
-                    click.echo(
-                        click.style(
-                            sub_line,
-                            fg=color,
-                        ),
-                        err=False,
-                    )
-
-        def _get_color_for_log_level(line: str) -> str:
-            if "ERROR" in line:
-                return "red"
-            elif "WARNING" in line:
-                return "yellow"
-            elif "DEBUG" in line:
-                return "blue"
-            elif "INFO" in line:
-                return "green"
-            else:
-                return "white"
-
         if is_debug:
-            threading.Thread(target=log_output, args=(process.stdout,)).start()
-            threading.Thread(target=log_output, args=(process.stderr,)).start()
+            self._watch_output(process.stdout)
+            self._watch_output(process.stderr)
 
         self.processes.append(process)
 
+    def _watch_output(self, pipe: Any) -> None:
+        import threading
+
+        if sys.platform == "win32":
+            # pipes cannot be polled with select on Windows
+            threading.Thread(target=self._read_pipe, args=(pipe,), daemon=True).start()
+            return
+
+        import selectors
+
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            threading.Thread(
+                target=self._drain_output, args=(self._selector,), daemon=True
+            ).start()
+        os.set_blocking(pipe.fileno(), False)
+        self._selector.register(pipe, selectors.EVENT_READ, bytearray())
+
+    def _read_pipe(self, pipe: Any) -> None:
+        for line in iter(pipe.readline, b""):
+            self._log_line(line.rstrip(b"\n"))
+
+    def _drain_output(self, selector: Any) -> None:
+        # a single thread multiplexes the output of every child process
+        while True:
+            for key, _ in selector.select(timeout=1):
+                buffer = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    if buffer:
+                        self._log_line(bytes(buffer))
+                    continue
+                buffer += chunk
+                *lines, rest = buffer.split(b"\n")
+                buffer[:] = rest
+                for line in lines:
+                    self._log_line(line)
+
+    def _log_line(self, raw_line: bytes) -> None:
+        # raw_line is a single line without its trailing newline
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\r")
+        if self._use_color:
+            prefix = _ANSI_COLOR_PREFIXES[_get_color_for_log_level(line)]
+            sys.stdout.write(f"{prefix}{line}{_ANSI_RESET}\n")
+        else:
+            sys.stdout.write(f"{line}\n")
+        sys.stdout.flush()
+
     def _terminate_processes(self) -> None:
+        import signal
+        import time
+
+        def _send(process: Any, sig: int) -> None:
+            try:
+                if sys.platform == "win32":
+                    process.send_signal(sig)
+                else:
+                    os.killpg(process.pid, sig)
+            except (ProcessLookupError, PermissionError, OSError):
+                pass
+
+        # signal every child first, then wait for all of them against one deadline
+        for process in self.processes:
+            _send(process, signal.SIGTERM)
+
+        deadline = time.monotonic() + 5
         for process in self.processes:
             try:
-                process.terminate()
-                process.wait(timeout=5)
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
             except Exception as e:
                 click.echo(
                     click.style(
@@ -195,11 +345,10 @@ class ApiTask(BaseTask):
                     ),
                     err=True,
                 )
-            finally:
-                try:
-                    process.kill()
-                except:  # noqa
-                    pass
+
+        for process in self.processes:
+            if process.poll() is None:
+                _send(process, getattr(signal, "SIGKILL", signal.SIGTERM))
 
     def _signal_handler(self, sig: Any, frame: Any) -> None:
         self._terminate_processes()
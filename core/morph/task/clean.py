@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -28,23 +29,28 @@ class CleanTask(BaseTask):
     def run(self):
         verbose = self.args.VERBOSE
 
-        if self.clean_dir.exists():
+        try:
+            entries = list(os.scandir(self.clean_dir))
+        except FileNotFoundError:
+            entries = None
+
+        if entries is not None:
             # Iterate through the contents of the .morph directory and remove files/directories
-            for item in self.clean_dir.iterdir():
-                if item.resolve() == self.frontend_dir.resolve():
+            for entry in entries:
+                if entry.name == self.frontend_dir.name:
                     # Remove frontend_dir only if force flag is set
                     if not self.force:
                         continue
 
                 # Display removal message in verbose mode
                 if verbose:
-                    click.echo(click.style(f"Removing {item}...", fg="yellow"))
+                    click.echo(click.style(f"Removing {entry.path}...", fg="yellow"))
 
                 # Remove files or directories
-                if item.is_dir():
-                    shutil.rmtree(item)
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
                 else:
-                    item.unlink()
+                    os.unlink(entry.path)
 
             # Ensure the .morph directory exists even after cleaning
             self.clean_dir.mkdir(parents=True, exist_ok=True)
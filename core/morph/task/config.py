@@ -1,11 +1,14 @@
-import configparser
 import os
 import socket
 import sys
 
 import click
 
-from morph.api.cloud.client import MorphApiClient, MorphApiKeyClientImpl
+from morph.api.cloud.client import (
+    MorphApiClient,
+    MorphApiKeyClientImpl,
+    parse_credentials_file,
+)
 from morph.constants import MorphConstant
 from morph.task.base import BaseTask
 
@@ -50,13 +53,11 @@ class ConfigTask(BaseTask):
         click.echo(click.style("✅ Verified", fg="green"))
 
         # Load existing file or create new one if it doesn't exist
-        config = configparser.ConfigParser()
         cred_file = os.path.join(morph_dir, "credentials")
-        if os.path.exists(cred_file):
-            config.read(cred_file)
+        config = parse_credentials_file(cred_file) if os.path.exists(cred_file) else {}
 
         # Warn user if profile already exists and prompt for overwrite
-        if config.has_section(profile_name):
+        if profile_name in config:
             warning_message = click.style(
                 f"Warning: Profile '{profile_name}' already exists. Overwrite?",
                 fg="yellow",
@@ -81,7 +82,11 @@ class ConfigTask(BaseTask):
 
         # Write the updated profile back to the file
         with open(cred_file, "w") as file:
-            config.write(file)
+            for section, values in config.items():
+                file.write(f"[{section}]\n")
+                for key, value in values.items():
+                    file.write(f"{key} = {value}\n")
+                file.write("\n")
 
         click.echo(f"Credentials saved to {cred_file}")
         click.echo(
@@ -1,30 +1,236 @@
+import fnmatch
+import io
 import os
+import random
 import re
-import select
+import shutil
+import socket
 import subprocess
 import sys
 import time
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import click
-import requests
 from tqdm import tqdm
 
+from morph.api.cloud.base import MorphClientResponse, get_http_session
 from morph.api.cloud.client import MorphApiKeyClientImpl
-from morph.api.cloud.types import EnvVarObject
+from morph.api.cloud.types import EnvVarList, EnvVarObject
 from morph.cli.flags import Flags
 from morph.config.project import load_project
+from morph.constants import MorphConstant
 from morph.task.base import BaseTask
 from morph.task.utils.file_upload import FileWithProgress
 from morph.task.utils.load_dockerfile import get_dockerfile_from_api
-from morph.task.utils.morph import find_project_root_dir
+from morph.task.utils.morph import find_project_root_dir, load_dotenv_values
+
+# a successful docker daemon check is trusted for this many seconds
+_DOCKER_PROBE_TTL = 60
+_DOCKER_SOCKET_PATH = "/var/run/docker.sock"
+# deployment status polling backs off from 1 s up to 30 s between requests
+_POLL_BASE_INTERVAL = 1
+_POLL_MAX_INTERVAL = 30
+# Regex to strip ANSI escape sequences for storing logs as plain text
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_BUILD_OUTPUT_READ_SIZE = 65536
+_UPLOAD_BUFFER_SIZE = 1024 * 1024
+_BUILD_CONTEXT_WARN_SIZE = 500 * 1024 * 1024
+_DOCKERFILE_FROM_RE = re.compile(
+    r"^\s*FROM\s+(?:--platform=\S+\s+)?(\S+)(?:\s+AS\s+(\S+))?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _docker_socket_accepts() -> bool:
+    """
+    Connects to the default local docker socket without spawning the docker CLI.
+    Returns False whenever the daemon may live elsewhere so the caller falls back to `docker info`.
+    """
+    if (
+        sys.platform == "win32"
+        or os.environ.get("DOCKER_HOST")
+        or os.environ.get("DOCKER_CONTEXT")
+    ):
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(0.2)
+    try:
+        sock.connect(_DOCKER_SOCKET_PATH)
+    except OSError:
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def _docker_daemon_running() -> bool:
+    """
+    Checks whether the docker daemon is reachable, reusing a recent successful check.
+    """
+    stamp_path = MorphConstant.MORPH_DOCKER_PROBE_PATH
+    try:
+        if time.time() - os.stat(stamp_path).st_mtime < _DOCKER_PROBE_TTL:
+            return True
+    except OSError:
+        pass
+
+    if not _docker_socket_accepts():
+        try:
+            subprocess.run(
+                ["docker", "info"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            return False
+
+    try:
+        os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+        Path(stamp_path).touch()
+    except OSError:
+        pass
+    return True
+
+
+def _buildx_supports_local_cache() -> bool:
+    """
+    Returns True when the active buildx builder can export its layer cache to a directory.
+    The default "docker" driver cannot, so builds there keep using the inline cache.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "buildx", "inspect"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return False
+    if result.returncode != 0:
+        return False
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "Driver":
+            return value.strip() not in ("", "docker")
+    return False
+
+
+def _docker_image_exists(image: str) -> bool:
+    """
+    Returns True when the image is present in the local docker image store.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "image", "inspect", image],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _dockerfile_base_images(dockerfile_path: str) -> List[str]:
+    """
+    Lists the registry images a Dockerfile builds FROM, skipping build stages and templated names.
+    """
+    try:
+        with open(dockerfile_path, "r") as f:
+            content = f.read()
+    except OSError:
+        return []
+
+    images: List[str] = []
+    stages = set()
+    for image, stage in _DOCKERFILE_FROM_RE.findall(content):
+        if (
+            "$" not in image
+            and image.lower() != "scratch"
+            and image.lower() not in stages
+            and image not in images
+        ):
+            images.append(image)
+        if stage:
+            stages.add(stage.lower())
+    return images
+
+
+def _read_dockerignore(project_root: str) -> List[Tuple[str, bool]]:
+    """
+    Returns the .dockerignore patterns as (pattern, is_exception) pairs.
+    """
+    patterns: List[Tuple[str, bool]] = []
+    try:
+        with open(os.path.join(project_root, ".dockerignore"), "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return patterns
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        is_exception = line.startswith("!")
+        pattern = os.path.normpath(line.lstrip("!").strip()).lstrip("/")
+        patterns.append(
+            (pattern.replace("**/", "*/").replace("/**", "/*"), is_exception)
+        )
+    return patterns
+
+
+def _is_dockerignored(rel_path: str, patterns: List[Tuple[str, bool]]) -> bool:
+    # the last matching pattern wins; a match on a parent directory also counts
+    ignored = False
+    for pattern, is_exception in patterns:
+        if (
+            fnmatch.fnmatchcase(rel_path, pattern)
+            or fnmatch.fnmatchcase(rel_path, f"{pattern}/*")
+            or (pattern.startswith("*/") and fnmatch.fnmatchcase(rel_path, pattern[2:]))
+        ):
+            ignored = not is_exception
+    return ignored
+
+
+def _build_context_sizes(project_root: str) -> Dict[str, int]:
+    """
+    Sums the size of everything docker would send as build context, per top-level entry.
+    This approximates the .dockerignore matching rules closely enough to spot large directories.
+    """
+    patterns = _read_dockerignore(project_root)
+    # without exceptions an ignored directory can be skipped as a whole
+    can_prune = not any(is_exception for _, is_exception in patterns)
+    sizes: Dict[str, int] = {}
+    for dir_path, dir_names, file_names in os.walk(project_root):
+        rel_dir = os.path.relpath(dir_path, project_root)
+        rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        if can_prune:
+            dir_names[:] = [
+                d for d in dir_names if not _is_dockerignored(rel_dir + d, patterns)
+            ]
+        for file_name in file_names:
+            rel_path = rel_dir + file_name
+            if _is_dockerignored(rel_path, patterns):
+                continue
+            try:
+                size = os.lstat(os.path.join(dir_path, file_name)).st_size
+            except OSError:
+                continue
+            top_level = rel_path.split("/", 1)[0]
+            sizes[top_level] = sizes.get(top_level, 0) + size
+    return sizes
 
 
 class DeployTask(BaseTask):
+    # set once the docker daemon has been found reachable in this process
+    _docker_checked = False
+
     def __init__(self, args: Flags):
         super().__init__(args)
         self.args = args
         self.no_cache = args.NO_CACHE
+        self.cache_from = getattr(args, "CACHE_FROM", None)
         self.is_verbose = args.VERBOSE
 
         # Attempt to find the project root
@@ -34,6 +240,9 @@ class DeployTask(BaseTask):
             click.echo(click.style(f"Error: {str(e)}", fg="red"))
             sys.exit(1)
 
+        # one directory listing answers every top-level existence check below
+        self._root_entries = {entry.name for entry in os.scandir(self.project_root)}
+
         # Load morph_project.yml or equivalent
         self.project = load_project(self.project_root)
         if not self.project:
@@ -51,7 +260,7 @@ class DeployTask(BaseTask):
 
         # Check Dockerfile existence
         self.dockerfile_path = os.path.join(self.project_root, "Dockerfile")
-        self.use_custom_dockerfile = os.path.exists(self.dockerfile_path)
+        self.use_custom_dockerfile = "Dockerfile" in self._root_entries
         if self.use_custom_dockerfile:
             provider = "aws"
             if (
@@ -76,28 +285,6 @@ class DeployTask(BaseTask):
             with open(dockerignore_path, "w") as f:
                 f.write(dockerignore)
 
-        # Check Docker availability
-        try:
-            click.echo(click.style("Checking Docker daemon status...", fg="blue"))
-            subprocess.run(["docker", "--version"], stdout=subprocess.PIPE, check=True)
-            subprocess.run(["docker", "info"], stdout=subprocess.PIPE, check=True)
-        except subprocess.CalledProcessError:
-            click.echo(
-                click.style(
-                    "Docker daemon is not running. Please (re)start Docker and try again.",
-                    fg="red",
-                )
-            )
-            sys.exit(1)
-        except FileNotFoundError:
-            click.echo(
-                click.style(
-                    "Docker is not installed. Please install Docker and try again.",
-                    fg="red",
-                )
-            )
-            sys.exit(1)
-
         # Initialize the Morph API client
         try:
             self.client = MorphApiKeyClientImpl()
@@ -106,20 +293,41 @@ class DeployTask(BaseTask):
             sys.exit(1)
 
         # Docker settings
-        self.image_name = f"{os.path.basename(self.project_root)}:latest"
-        self.output_tar = os.path.join(
-            self.project_root, f".morph/{os.path.basename(self.project_root)}.tar"
+        project_name = os.path.basename(self.project_root)
+        self.image_name = f"{project_name}:latest"
+        self.output_tar = os.path.join(self.project_root, f".morph/{project_name}.tar")
+        # kept outside the project so that it never becomes part of the build context
+        self.build_cache_dir = os.path.join(
+            MorphConstant.INIT_DIR, "buildcache", self.project.project_id
         )
 
+        self.env_file = os.path.join(self.project_root, ".env")
+        self.requirements_file = os.path.join(self.project_root, "requirements.txt")
+        self.pyproject_file = os.path.join(self.project_root, "pyproject.toml")
+        # environment variables currently set in the Morph Cloud, when they could be read
+        self.cloud_env_vars: Optional[Dict[str, str]] = None
+
+        # Check Docker availability
+        self._check_docker()
+
         # Verify dependencies
         self._verify_dependencies()
 
-        # Verify environment variables
-        self.env_file = os.path.join(self.project_root, ".env")
-        self.should_override_env = self._verify_environment_variables()
+        # the API key check and the cloud environment variable lookup are independent
+        # round-trips, so they run concurrently; their results are reported in order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            api_key_check = executor.submit(self.client.check_api_secret)
+            env_vars_fetch = (
+                executor.submit(self.client.list_env_vars)
+                if ".env" in self._root_entries
+                else None
+            )
+            self._validate_api_key(api_key_check)
+            if env_vars_fetch is not None:
+                self._check_env_vars(env_vars_fetch)
 
-        # Validate API key
-        self._validate_api_key()
+        # Verify environment variables (prompts the user, so it runs last)
+        self.should_override_env = self._verify_environment_variables()
 
     def run(self):
         """
@@ -127,21 +335,41 @@ class DeployTask(BaseTask):
         """
         click.echo(click.style("Initiating deployment sequence...", fg="blue"))
 
-        # 1. Build the source code
-        self._build_source()
+        # 1. Build the source code while the base images are being pulled
+        base_image_pulls = [
+            subprocess.Popen(
+                ["docker", "pull", "--quiet", image],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for image in _dockerfile_base_images(self.dockerfile_path)
+        ]
+        try:
+            self._build_source()
+        except BaseException:
+            # do not leave the pulls running when compiling fails or is interrupted
+            for process in base_image_pulls:
+                process.terminate()
+            raise
+        finally:
+            # failures are left for `docker build` to report
+            for process in base_image_pulls:
+                process.wait()
 
         # 2. Build the Docker image
         click.echo(click.style("Building Docker image...", fg="blue"))
+        self._warn_on_large_build_context()
         image_build_log = self._build_docker_image()
+        self._promote_build_cache()
 
-        # 3. Save Docker image as .tar
-        click.echo(click.style("Saving Docker image as .tar...", fg="blue"))
-        self._save_docker_image()
-
-        # 4. Compute the checksum of the .tar file
+        # 3. Compute the checksum of the Docker image
         image_checksum = self._get_image_digest(self.image_name)
         click.echo(click.style(f"Docker image checksum: {image_checksum}", fg="blue"))
 
+        # 4. Save Docker image as .tar
+        click.echo(click.style("Saving Docker image as .tar...", fg="blue"))
+        self._save_docker_image(image_checksum)
+
         # 5. Call the Morph API to initialize a deployment and get the pre-signed URL
         try:
             initialize_resp = self.client.initiate_deployment(
@@ -204,8 +432,7 @@ class DeployTask(BaseTask):
         and ensures 'morph-data' is included in the dependencies.
         """
         if self.package_manager == "pip":
-            requirements_file = os.path.join(self.project_root, "requirements.txt")
-            if not os.path.exists(requirements_file):
+            if "requirements.txt" not in self._root_entries:
                 click.echo(
                     click.style(
                         "Error: 'requirements.txt' is missing. Please create it.",
@@ -215,7 +442,7 @@ class DeployTask(BaseTask):
                 sys.exit(1)
 
             # Check if 'morph-data' is listed in requirements.txt
-            with open(requirements_file, "r") as f:
+            with open(self.requirements_file, "r") as f:
                 requirements = f.read()
             if "morph-data" not in requirements:
                 click.echo(
@@ -226,10 +453,9 @@ class DeployTask(BaseTask):
                 )
                 sys.exit(1)
         elif self.package_manager == "poetry":
-            pyproject_file = os.path.join(self.project_root, "pyproject.toml")
-            requirements_file = os.path.join(self.project_root, "requirements.txt")
-
-            missing_files = [f for f in [pyproject_file] if not os.path.exists(f)]
+            missing_files = (
+                [] if "pyproject.toml" in self._root_entries else [self.pyproject_file]
+            )
             if missing_files:
                 click.echo(
                     click.style(
@@ -240,7 +466,7 @@ class DeployTask(BaseTask):
                 sys.exit(1)
 
             # Check if 'morph-data' is listed in pyproject.toml
-            with open(pyproject_file, "r") as f:
+            with open(self.pyproject_file, "r") as f:
                 pyproject_content = f.read()
             if "morph-data" not in pyproject_content:
                 click.echo(
@@ -264,14 +490,14 @@ class DeployTask(BaseTask):
                         "-f",
                         "requirements.txt",
                         "-o",
-                        requirements_file,
+                        self.requirements_file,
                         "--without-hashes",
                     ],
                     check=True,
                 )
                 click.echo(
                     click.style(
-                        f"'requirements.txt' generated successfully at: {requirements_file}",
+                        f"'requirements.txt' generated successfully at: {self.requirements_file}",
                         fg="green",
                     )
                 )
@@ -281,10 +507,9 @@ class DeployTask(BaseTask):
                 )
                 sys.exit(1)
         elif self.package_manager == "uv":
-            uv_project_file = os.path.join(self.project_root, "pyproject.toml")
-            requirements_file = os.path.join(self.project_root, "requirements.txt")
-
-            missing_files = [f for f in [uv_project_file] if not os.path.exists(f)]
+            missing_files = (
+                [] if "pyproject.toml" in self._root_entries else [self.pyproject_file]
+            )
             if missing_files:
                 click.echo(
                     click.style(
@@ -295,7 +520,7 @@ class DeployTask(BaseTask):
                 sys.exit(1)
 
             # Check if 'morph-data' is listed in pyproject.yoml
-            with open(uv_project_file, "r") as f:
+            with open(self.pyproject_file, "r") as f:
                 uv_project_content = f.read()
             if "morph-data" not in uv_project_content:
                 click.echo(
@@ -320,13 +545,13 @@ class DeployTask(BaseTask):
                         "compile",
                         "pyproject.toml",
                         "-o",
-                        requirements_file,
+                        self.requirements_file,
                     ],
                     check=True,
                 )
                 click.echo(
                     click.style(
-                        f"'requirements.txt' generated successfully at: {requirements_file}",
+                        f"'requirements.txt' generated successfully at: {self.requirements_file}",
                         fg="green",
                     )
                 )
@@ -344,14 +569,33 @@ class DeployTask(BaseTask):
             )
             sys.exit(1)
 
-    def _verify_environment_variables(self) -> bool:
-        # Nothing to do if .env file does not exist
-        if not os.path.exists(self.env_file):
-            return False
+    def _check_docker(self) -> None:
+        # Check Docker availability (once per process)
+        if DeployTask._docker_checked:
+            return
+        click.echo(click.style("Checking Docker daemon status...", fg="blue"))
+        if shutil.which("docker") is None:
+            click.echo(
+                click.style(
+                    "Docker is not installed. Please install Docker and try again.",
+                    fg="red",
+                )
+            )
+            sys.exit(1)
+        if not _docker_daemon_running():
+            click.echo(
+                click.style(
+                    "Docker daemon is not running. Please (re)start Docker and try again.",
+                    fg="red",
+                )
+            )
+            sys.exit(1)
+        DeployTask._docker_checked = True
 
+    def _check_env_vars(self, env_vars_fetch: Future[MorphClientResponse]) -> None:
         # Check environment variables in the Morph Cloud
         try:
-            env_vars_resp = self.client.list_env_vars()
+            env_vars_resp = env_vars_fetch.result()
         except Exception as e:
             click.echo(
                 click.style(f"Error fetching environment variables: {str(e)}", fg="red")
@@ -367,6 +611,29 @@ class DeployTask(BaseTask):
             )
             sys.exit(1)
 
+        try:
+            env_var_list = env_vars_resp.to_model(EnvVarList)
+        except Exception:  # noqa
+            env_var_list = None
+        if env_var_list is not None:
+            self.cloud_env_vars = {item.key: item.value for item in env_var_list.items}
+
+    def _verify_environment_variables(self) -> bool:
+        # Nothing to do if .env file does not exist
+        if ".env" not in self._root_entries:
+            return False
+
+        # Nothing to override if the Morph Cloud already has the same values
+        if self.cloud_env_vars is not None:
+            if load_dotenv_values(self.env_file) == self.cloud_env_vars:
+                click.echo(
+                    click.style(
+                        "Local .env matches the Morph Cloud environment variables.",
+                        fg="blue",
+                    )
+                )
+                return False
+
         # Request user input to decide whether to override environment variables
         click.echo(click.style("Detected a local .env file!", fg="yellow"))
         click.echo(click.style("Choose how to proceed:", fg="blue"))
@@ -399,8 +666,8 @@ class DeployTask(BaseTask):
             )
             return False
 
-    def _validate_api_key(self):
-        res = self.client.check_api_secret()
+    def _validate_api_key(self, api_key_check: Future[MorphClientResponse]) -> None:
+        res = api_key_check.result()
         if res.is_error():
             click.echo(
                 click.style(
@@ -425,10 +692,33 @@ class DeployTask(BaseTask):
             click.echo(click.style(f"Unexpected error: {str(e)}", fg="red"))
             sys.exit(1)
 
+    def _warn_on_large_build_context(self) -> None:
+        """
+        Warns when the docker build context is large, usually because .dockerignore misses
+        directories such as node_modules or .venv that docker would upload on every build.
+        """
+        sizes = _build_context_sizes(self.project_root)
+        total = sum(sizes.values())
+        if total <= _BUILD_CONTEXT_WARN_SIZE:
+            return
+
+        click.echo(
+            click.style(
+                f"Warning: the Docker build context is {total / (1024 * 1024):.2f} MB. "
+                "Consider adding large entries to .dockerignore:",
+                fg="yellow",
+            )
+        )
+        largest = sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:10]
+        for name, size in largest:
+            click.echo(
+                click.style(f"  {name} ({size / (1024 * 1024):.2f} MB)", fg="yellow")
+            )
+
     def _build_docker_image(self) -> str:
         """
-        Builds the Docker image using a pseudo-terminal (PTY) to preserve colored output on Unix-like systems.
-        On Windows, termios/pty is not available, so we fall back to a simpler subprocess approach.
+        Builds the Docker image using a pseudo-terminal (PTY) to preserve colored output when stdout is a terminal on Unix-like systems.
+        Otherwise, and on Windows where termios/pty is not available, the output is read from a pipe.
         """
         docker_build_cmd = [
             "docker",
@@ -442,169 +732,178 @@ class DeployTask(BaseTask):
         ]
         if self.no_cache:
             docker_build_cmd.append("--no-cache")
-
-        # Regex to strip ANSI escape sequences for storing logs as plain text
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+        elif _buildx_supports_local_cache():
+            # the layer cache survives `docker system prune` and fresh builders
+            docker_build_cmd[1:2] = ["buildx", "build", "--load"]
+            if os.path.isdir(self.build_cache_dir):
+                docker_build_cmd.append(
+                    f"--cache-from=type=local,src={self.build_cache_dir}"
+                )
+            docker_build_cmd.append(
+                f"--cache-to=type=local,dest={self.build_cache_dir}.new,mode=max"
+            )
+        else:
+            # embed cache metadata so the next build can reuse layers of this image
+            docker_build_cmd += ["--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+            # the docker driver reads the local image store, so the previous image is
+            # only passed when it exists there and never looked up in a registry
+            if _docker_image_exists(self.image_name):
+                docker_build_cmd += ["--cache-from", self.image_name]
+        if self.cache_from and not self.no_cache:
+            # e.g. a registry image pushed by CI, so fresh machines start warm
+            docker_build_cmd += ["--cache-from", self.cache_from]
+        build_env = {**os.environ, "DOCKER_BUILDKIT": "1"}
 
         if sys.platform == "win32":
             click.echo(
                 click.style("Detected Windows: skipping PTY usage.", fg="yellow")
             )
-            try:
-                process = subprocess.Popen(
-                    docker_build_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                )
-
-                build_logs = []
-
-                while True:
-                    line = process.stdout.readline()
-                    if not line and process.poll() is not None:
-                        break
-                    if line:
-                        clean_text = ansi_escape.sub("", line)
-                        build_logs.append(clean_text)
-                        # ローカル表示用にカラーをつけて出力
-                        colored_chunk = click.style(clean_text, fg="blue")
-                        sys.stdout.write(colored_chunk)
-                        sys.stdout.flush()
-
-                err_text = process.stderr.read()
-                if err_text:
-                    clean_text = ansi_escape.sub("", err_text)
-                    build_logs.append(clean_text)
-                    colored_chunk = click.style(clean_text, fg="blue")
-                    sys.stdout.write(colored_chunk)
-                    sys.stdout.flush()
-
-                return_code = process.wait()
-                if return_code != 0:
-                    all_logs = "".join(build_logs)
-                    raise subprocess.CalledProcessError(
-                        return_code, docker_build_cmd, output=all_logs
-                    )
+        try:
+            if sys.platform != "win32" and sys.stdout.isatty():
+                return_code, build_logs = self._run_build_in_pty(
+                    docker_build_cmd, build_env
+                )
+            else:
+                return_code, build_logs = self._run_build_in_pipe(
+                    docker_build_cmd, build_env
+                )
+            # escape sequences are stripped once from the whole log, not per chunk
+            build_log = _ANSI_ESCAPE_RE.sub(
+                "", b"".join(build_logs).decode(errors="replace")
+            )
+            if return_code != 0:
+                raise subprocess.CalledProcessError(
+                    return_code, docker_build_cmd, output=build_log
+                )
 
-                click.echo(
-                    click.style(
-                        f"Docker image '{self.image_name}' built successfully.",
-                        fg="green",
-                    )
+            click.echo(
+                click.style(
+                    f"Docker image '{self.image_name}' built successfully.",
+                    fg="green",
                 )
-                return "".join(build_logs)
+            )
+            return build_log
 
-            except subprocess.CalledProcessError as e:
-                click.echo(
-                    click.style(
-                        f"Error building Docker image '{self.image_name}': {e.output}",
-                        fg="red",
-                    )
+        except subprocess.CalledProcessError:
+            click.echo(
+                click.style(
+                    f"Error building Docker image '{self.image_name}'.", fg="red"
                 )
-                sys.exit(1)
-            except Exception as e:
-                click.echo(
-                    click.style(
-                        f"Unexpected error while building Docker image: {str(e)}",
-                        fg="red",
-                    )
+            )
+            sys.exit(1)
+        except Exception as e:
+            click.echo(
+                click.style(
+                    f"Unexpected error while building Docker image: {str(e)}",
+                    fg="red",
                 )
-                sys.exit(1)
+            )
+            sys.exit(1)
 
-        else:
+    def _run_build_in_pty(
+        self, command: List[str], env: Dict[str, str]
+    ) -> Tuple[int, List[bytes]]:
+        import pty
+
+        master_fd, slave_fd = pty.openpty()
+
+        process = subprocess.Popen(
+            command,
+            stdin=slave_fd,
+            stdout=slave_fd,
+            stderr=slave_fd,
+            text=False,
+            bufsize=0,
+            env=env,
+        )
+
+        os.close(slave_fd)
+
+        # blocking reads until the build closes the terminal; the exit code is collected afterwards
+        build_logs = []
+        while True:
             try:
-                import pty
-
-                master_fd, slave_fd = pty.openpty()
-
-                process = subprocess.Popen(
-                    docker_build_cmd,
-                    stdin=slave_fd,
-                    stdout=slave_fd,
-                    stderr=slave_fd,
-                    text=False,
-                    bufsize=0,
-                )
-
-                os.close(slave_fd)
-
-                build_logs = []
-
-                while True:
-                    r, _, _ = select.select([master_fd], [], [], 0.1)
-                    if master_fd in r:
-                        try:
-                            chunk = os.read(master_fd, 1024)
-                        except OSError:
-                            break
-                        if not chunk:
-                            break
-                        text_chunk = chunk.decode(errors="replace")
-                        clean_text = ansi_escape.sub("", text_chunk)
-                        build_logs.append(clean_text)
-                        colored_chunk = click.style(clean_text, fg="blue")
-                        sys.stdout.write(colored_chunk)
-                        sys.stdout.flush()
-
-                    if process.poll() is not None:
-                        while True:
-                            try:
-                                chunk = os.read(master_fd, 1024)
-                                if not chunk:
-                                    break
-                                text_chunk = chunk.decode(errors="replace")
-                                clean_text = ansi_escape.sub("", text_chunk)
-                                build_logs.append(clean_text)
-                                colored_chunk = click.style(clean_text, fg="blue")
-                                sys.stdout.write(colored_chunk)
-                                sys.stdout.flush()
-                            except OSError:
-                                break
-                        break
-
-                os.close(master_fd)
-                return_code = process.wait()
-                if return_code != 0:
-                    all_logs = "".join(build_logs)
-                    raise subprocess.CalledProcessError(
-                        return_code, docker_build_cmd, output=all_logs
-                    )
+                chunk = os.read(master_fd, _BUILD_OUTPUT_READ_SIZE)
+            except OSError:
+                break
+            if not chunk:
+                break
+            build_logs.append(self._echo_build_output(chunk))
+
+        os.close(master_fd)
+        return process.wait(), build_logs
+
+    def _run_build_in_pipe(
+        self, command: List[str], env: Dict[str, str]
+    ) -> Tuple[int, List[bytes]]:
+        # without a terminal to emulate, a plain pipe carries both streams in large reads
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env,
+        )
+        assert process.stdout is not None
+        stdout_fd = process.stdout.fileno()
 
-                click.echo(
-                    click.style(
-                        f"Docker image '{self.image_name}' built successfully.",
-                        fg="green",
-                    )
-                )
-                return "".join(build_logs)
+        build_logs = []
+        for chunk in iter(lambda: os.read(stdout_fd, _BUILD_OUTPUT_READ_SIZE), b""):
+            build_logs.append(self._echo_build_output(chunk))
 
-            except subprocess.CalledProcessError:
-                click.echo(
-                    click.style(
-                        f"Error building Docker image '{self.image_name}'.", fg="red"
-                    )
-                )
-                sys.exit(1)
-            except Exception as e:
-                click.echo(
-                    click.style(
-                        f"Unexpected error while building Docker image: {str(e)}",
-                        fg="red",
-                    )
-                )
-                sys.exit(1)
+        return process.wait(), build_logs
+
+    @staticmethod
+    def _echo_build_output(chunk: bytes) -> bytes:
+        # docker's own colors are passed through as-is
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is not None:
+            sys.stdout.flush()
+            stdout_buffer.write(chunk)
+            stdout_buffer.flush()
+        else:
+            sys.stdout.write(chunk.decode(errors="replace"))
+            sys.stdout.flush()
+        return chunk
+
+    def _promote_build_cache(self) -> None:
+        """
+        Replaces the local build cache with the one exported by the last successful build.
+        Exporting into a fresh directory keeps blobs of old builds from piling up.
+        """
+        new_cache_dir = f"{self.build_cache_dir}.new"
+        if not os.path.isdir(new_cache_dir):
+            return
+        shutil.rmtree(self.build_cache_dir, ignore_errors=True)
+        os.replace(new_cache_dir, self.build_cache_dir)
 
-    def _save_docker_image(self):
+    def _save_docker_image(self, image_digest: str) -> None:
         """
         Saves the Docker image as a .tar file without compression.
+        The .tar of a previous deployment is reused when the image digest has not changed.
         """
+        digest_path = f"{self.output_tar}.digest"
+        try:
+            with open(digest_path, "r") as f:
+                saved_digest = f.read()
+        except OSError:
+            saved_digest = None
+        if saved_digest == image_digest and os.path.exists(self.output_tar):
+            click.echo(
+                click.style(
+                    f"Docker image is unchanged, reusing '{self.output_tar}'.",
+                    fg="blue",
+                )
+            )
+            return
+
         try:
             output_dir = os.path.dirname(self.output_tar)
             os.makedirs(output_dir, exist_ok=True)
 
-            if os.path.exists(self.output_tar):
-                os.remove(self.output_tar)  # remove any existing file
+            # remove any existing file
+            for path in (digest_path, self.output_tar):
+                if os.path.exists(path):
+                    os.remove(path)
 
             # Docker save command with -o option
             subprocess.run(
@@ -613,6 +912,8 @@ class DeployTask(BaseTask):
             )
             if not os.path.exists(self.output_tar):
                 raise FileNotFoundError("Docker save failed to produce the .tar file.")
+            with open(digest_path, "w") as f:
+                f.write(image_digest)
 
             file_size_mb = os.path.getsize(self.output_tar) / (1024 * 1024)
             click.echo(
@@ -685,9 +986,10 @@ class DeployTask(BaseTask):
                     "Content-Type": "application/octet-stream",
                     "Content-Length": str(file_size),
                 }
-                response = requests.put(
+                # the HTTP client reads small blocks; the buffer turns them into large file reads
+                response = get_http_session().put(
                     presigned_url,
-                    data=fwp,
+                    data=io.BufferedReader(fwp, buffer_size=_UPLOAD_BUFFER_SIZE),
                     headers=headers,
                 )
 
@@ -713,13 +1015,10 @@ class DeployTask(BaseTask):
             nl=False,
         )
 
-        env_vars: List[EnvVarObject] = []
-        with open(self.env_file, "r") as f:
-            for line in f:
-                if not line.strip() or line.startswith("#"):
-                    continue
-                key, value = line.strip().split("=", 1)
-                env_vars.append(EnvVarObject(key=key, value=value))
+        env_vars: List[EnvVarObject] = [
+            EnvVarObject(key=key, value=value)
+            for key, value in load_dotenv_values(self.env_file).items()
+        ]
 
         try:
             override_res = self.client.override_env_vars(env_vars=env_vars)
@@ -758,7 +1057,7 @@ class DeployTask(BaseTask):
             enable_status_polling (bool): Enable status polling. Default is False.
         """
         start_time = time.time()
-        interval = 5  # Initial polling interval in seconds
+        attempt = 0
 
         click.echo(
             click.style(
@@ -781,10 +1080,17 @@ class DeployTask(BaseTask):
             click.echo(click.style(f"Error executing deployment: {str(e)}", fg="red"))
             sys.exit(1)
 
-        if not enable_status_polling:
-            status = execute_resp.json().get("status")
-            if status == "succeeded":
-                return
+        status = execute_resp.json().get("status")
+        if status == "succeeded" and not enable_status_polling:
+            return
+        if status == "failed":
+            click.echo(
+                click.style(
+                    f"Deployment failed: {execute_resp.json().get('message')}",
+                    fg="red",
+                )
+            )
+            sys.exit(1)
 
         click.echo(
             click.style(
@@ -794,8 +1100,24 @@ class DeployTask(BaseTask):
             nl=False,
         )
 
-        # Monitor the deployment status
+        # Monitor the deployment status, waiting before every request since the
+        # execute call above already reported the current status
+        status_resp = execute_resp
         while True:
+            # Exponential backoff with jitter, unless the server asks for a specific delay
+            interval = min(
+                _POLL_MAX_INTERVAL, _POLL_BASE_INTERVAL * 2**attempt
+            ) + random.uniform(0, 1)
+            attempt += 1
+            retry_after = status_resp.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    interval = max(float(retry_after), 0)
+                except ValueError:
+                    pass
+
+            time.sleep(min(interval, max(timeout - (time.time() - start_time), 0)))
+
             elapsed_time = time.time() - start_time
             if elapsed_time > timeout:
                 click.echo("")
@@ -851,13 +1173,3 @@ class DeployTask(BaseTask):
                     click.style(f"Error fetching deployment status: {str(e)}", fg="red")
                 )
                 sys.exit(1)
-
-            # Adjust polling interval dynamically
-            if elapsed_time < 300:  # First 5 minutes
-                interval = 5
-            elif elapsed_time < 600:  # Next 5 minutes
-                interval = 15
-            else:  # Beyond 10 minutes
-                interval = 30
-
-            time.sleep(interval)
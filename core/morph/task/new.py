@@ -1,4 +1,3 @@
-import importlib.metadata
 import os
 import re
 import shutil
@@ -8,7 +7,7 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from morph.cli.flags import Flags
+from morph.cli.flags import Flags, get_current_version
 from morph.config.project import (
     BuildConfig,
     default_initial_project,
@@ -117,10 +116,8 @@ class NewTask(BaseTask):
 
         save_project(self.project_root, project)
 
-        try:
-            morph_data_version = importlib.metadata.version("morph-data")
-        except importlib.metadata.PackageNotFoundError:
-            morph_data_version = None
+        morph_data_version = get_current_version()
+        if morph_data_version is None:
             click.echo(
                 click.style(
                     "No local 'morph-data' found. Using unpinned (no version).",
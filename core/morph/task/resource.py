@@ -49,6 +49,18 @@ class PrintResourceTask(BaseTask):
             raise e
 
     def run(self):
+        output = self.collect()
+        if "resources" in output:
+            click.echo(json.dumps(output, indent=2))
+        elif self.target_type == "alias":
+            click.echo(f"Alias {self.target} not found.")
+        elif self.target_type == "file":
+            click.echo(f"File {self.target} not found.")
+
+    def collect(self) -> dict[str, Any]:
+        """Collect the resources as a dict without printing them.
+        "resources" is missing when the target alias or file is not found.
+        """
         try:
             cache = MorphFunctionMetaObjectCacheManager().get_cache()
         except (pydantic.ValidationError, json.decoder.JSONDecodeError):
@@ -131,7 +143,6 @@ class PrintResourceTask(BaseTask):
                 resource_dicts.append(resource_item.model_dump())
 
             output["resources"] = resource_dicts
-            click.echo(json.dumps(output, indent=2))
         elif self.target_type == "alias":
             # NOTE: use Resource entity to keep backward compatibility with old output format
             resource: Resource | None = None
@@ -156,9 +167,6 @@ class PrintResourceTask(BaseTask):
                     break
             if resource:
                 output["resources"] = [resource.model_dump()]
-                click.echo(json.dumps(output, indent=2))
-            else:
-                click.echo(f"Alias {self.target} not found.")
         elif self.target_type == "file":
             abs_path = Path(self.target).as_posix()
             resource = None
@@ -183,6 +191,5 @@ class PrintResourceTask(BaseTask):
                     break
             if resource:
                 output["resources"] = [resource.model_dump()]
-                click.echo(json.dumps(output, indent=2))
-            else:
-                click.echo(f"File {self.target} not found.")
+
+        return output
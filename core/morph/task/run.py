@@ -8,14 +8,13 @@ from typing import Any, Dict, List, Literal, Optional
 import click
 import pandas as pd
 import pydantic
-from dotenv import dotenv_values, load_dotenv
 from tabulate import tabulate
 
 from morph.cli.flags import Flags
 from morph.config.project import MorphProject, load_project
 from morph.task.base import BaseTask
 from morph.task.utils.logging import get_morph_logger
-from morph.task.utils.morph import find_project_root_dir
+from morph.task.utils.morph import find_project_root_dir, load_dotenv_values
 from morph.task.utils.run_backend.errors import (
     MorphFunctionLoadError,
     logging_file_error_exception,
@@ -75,10 +74,7 @@ class RunTask(BaseTask):
 
         # load .env in project root
         dotenv_path = os.path.join(self.project_root, ".env")
-        load_dotenv(dotenv_path)
-        env_vars = dotenv_values(dotenv_path)
-        for e_key, e_val in env_vars.items():
-            os.environ[e_key] = str(e_val)
+        os.environ.update(load_dotenv_values(dotenv_path))
 
         context = MorphGlobalContext.get_instance()
         try:
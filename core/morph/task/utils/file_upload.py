@@ -1,15 +1,34 @@
+import io
 import os
 
 
-class FileWithProgress:
+class FileWithProgress(io.RawIOBase):
+    mode = "rb"
+
     def __init__(self, file_path, pbar):
+        super().__init__()
         self._file_path = file_path
-        self._f = open(file_path, "rb")
+        self._f = open(file_path, "rb", buffering=0)
         self._pbar = pbar
 
     def __len__(self):
         return os.path.getsize(self._file_path)
 
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Read up to len(buffer) bytes into buffer and update the progress bar.
+        Wrapping the object in io.BufferedReader makes this the only read path.
+        @param buffer:
+        @return:
+        """
+        n = self._f.readinto(buffer)
+        if n:
+            self._pbar.update(n)
+        return n
+
     def read(self, size=-1):
         """
         Read up to size bytes from the object and update the progress bar.
@@ -21,9 +40,22 @@ class FileWithProgress:
             self._pbar.update(len(data))
         return data
 
+    def fileno(self):
+        return self._f.fileno()
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._f.seek(offset, whence)
+
+    def tell(self):
+        return self._f.tell()
+
     def close(self):
         if not self._f.closed:
             self._f.close()
+        super().close()
 
     def __iter__(self):
         """
@@ -1,15 +1,19 @@
 import base64
+import functools
 import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from morph.constants import MorphConstant
 from pydantic import BaseModel
 
 IGNORE_DIRS = ["/private/tmp", "/tmp"]
 
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+BASE64_PATTERN = re.compile(r"^[A-Za-z0-9+/=]*$")
+
 
 def find_project_root_dir(abs_filepath: Optional[str] = None) -> str:
     current_dir = (
@@ -20,6 +24,13 @@ def find_project_root_dir(abs_filepath: Optional[str] = None) -> str:
         if ignore_dir in current_dir:
             current_dir = os.getcwd()
 
+    return _find_project_root_dir(current_dir)
+
+
+@functools.lru_cache(maxsize=64)
+def _find_project_root_dir(current_dir: str) -> str:
+    # NOTE: results are cached per start directory since this is called on every API request.
+    # Failed lookups raise and therefore are never cached.
     project_yaml_files = ["morph_project.yml", "morph_project.yaml"]
     while current_dir != os.path.dirname(current_dir):
         for project_yaml_file in project_yaml_files:
@@ -39,6 +50,26 @@ def find_project_root_dir(abs_filepath: Optional[str] = None) -> str:
     )
 
 
+def clear_project_root_dir_cache() -> None:
+    _find_project_root_dir.cache_clear()
+
+
+def load_dotenv_values(dotenv_path: str) -> Dict[str, str]:
+    """Return the variables defined in a .env file, parsing it again only when it changes."""
+    try:
+        mtime_ns = os.stat(dotenv_path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_dotenv_values(dotenv_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_dotenv_values(dotenv_path: str, mtime_ns: int) -> Dict[str, str]:
+    from dotenv import dotenv_values
+
+    return {k: v for k, v in dotenv_values(dotenv_path).items() if v is not None}
+
+
 class Resource(BaseModel):
     alias: str
     path: str
@@ -103,21 +134,22 @@ class Resource(BaseModel):
             output_files = [original_output_path]
             for output_file in output_files:
                 if isinstance(output, list):
+                    ext = os.path.splitext(output_file)[1]
+                    should_save_as_html = ext == ".html"
+                    should_save_as_png = ext == ".png"
+
                     # For multiple outputs, HTML and PNG outputs are saved as files
                     for raw_output in output:
-                        should_save_as_html = output_file.endswith(".html")
-                        should_save_as_png = output_file.endswith(".png")
-
                         is_html_encoded = (
                             isinstance(raw_output, str)
-                            and re.compile(r"<[^>]+>").search(raw_output) is not None
+                            and HTML_TAG_PATTERN.search(raw_output) is not None
                         )
                         if should_save_as_html and not is_html_encoded:
                             continue
 
                         is_base64_encoded = (
                             isinstance(raw_output, str)
-                            and re.match(r"^[A-Za-z0-9+/=]*$", raw_output) is not None
+                            and BASE64_PATTERN.match(raw_output) is not None
                         )
                         if should_save_as_png and not is_base64_encoded:
                             continue
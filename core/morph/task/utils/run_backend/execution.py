@@ -74,7 +74,7 @@ def run_cell(
     # is_cache_valid = True
 
     # If SQL, register data requirements
-    ext = meta_obj.id.split(".")[-1]
+    ext = os.path.splitext(meta_obj.id)[1].lstrip(".").lower()
     if ext == "sql":
         _regist_sql_data_requirements(meta_obj)
         meta_obj = context.search_meta_object_by_name(meta_obj.name or "")
@@ -26,22 +26,30 @@ class DirectoryScanResult(BaseModel):
     errors: List[MorphFunctionLoadError]
 
 
+_CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+
+def _update_checksum(hash_func: Any, file_path: str) -> None:
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHECKSUM_CHUNK_SIZE), b""):
+            hash_func.update(chunk)
+
+
 def get_checksum(path: Path) -> str:
     """get checksum of file or directory."""
-    hash_func = hashlib.sha256()
-
     if path.is_file():
-        with open(str(path), "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # python 3.11+
+            with open(str(path), "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
 
+        hash_func = hashlib.sha256()
+        _update_checksum(hash_func, str(path))
         return hash_func.hexdigest()
     elif path.is_dir():
+        hash_func = hashlib.sha256()
         for file in sorted(path.glob("**/*")):
             if file.is_file() and (file.suffix == ".py" or file.suffix == ".sql"):
-                with open(str(file), "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_func.update(chunk)
+                _update_checksum(hash_func, str(file))
 
         return hash_func.hexdigest()
     else:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import os
 import sys
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -222,7 +223,7 @@ class MorphGlobalContext:
                 )
             ]
 
-        suffix = target_item.file_path.split(".")[-1]
+        suffix = os.path.splitext(target_item.file_path)[1].lstrip(".").lower()
         if suffix == "py":
             for data_requirement in target_item.spec.data_requirements or []:
                 for cache_error in cache.errors:
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from morph.api.cloud.client import parse_credentials_file
+
+
+def test_parse_credentials_file(tmp_path: Path) -> None:
+    credentials_path = tmp_path / "credentials"
+    credentials_path.write_text(
+        "# comment\n"
+        "[default]\n"
+        "API_KEY = secret = value\n"
+        "\n"
+        "; another comment\n"
+        "[ production ]\n"
+        "api_key=prod\n"
+    )
+
+    assert parse_credentials_file(str(credentials_path)) == {
+        "default": {"api_key": "secret = value"},
+        "production": {"api_key": "prod"},
+    }
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from morph.api import service
+from morph.api.custom_types import RunFileStreamService
+from morph.api.error import WarningError
+
+
+class _StubRunTask:
+    def __init__(self, result: Any):
+        self._result = result
+
+    def run(self) -> Any:
+        return self._result
+
+
+async def _collect_stream(monkeypatch: pytest.MonkeyPatch, result: Any) -> List[str]:
+    monkeypatch.setattr(service, "_check_alias", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        service, "_prepare_run_task", lambda *args, **kwargs: _StubRunTask(result)
+    )
+    return [
+        chunk
+        async for chunk in service.run_file_stream_service(
+            RunFileStreamService(name="alias", variables=None)
+        )
+    ]
+
+
+async def test_run_file_stream_service_with_generator(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    chunks = await _collect_stream(monkeypatch, (c for c in ["p", "q"]))
+    assert "".join(chunks) == '{"chunks": [p,q,]}'
+
+
+async def test_run_file_stream_service_with_list(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    chunks = await _collect_stream(monkeypatch, ["p", "q"])
+    assert "".join(chunks) == '{"chunks": [p,q,]}'
+
+
+class _CountingContext:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def partial_load(self, project_root: str, name: str) -> List[Any]:
+        self.calls += 1
+        return []
+
+
+def test_partial_load_memo_is_invalidated_by_source_changes(tmp_path: Path) -> None:
+    (tmp_path / "morph_project.yml").write_text("source_paths:\n- src\n")
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    source_file = source_dir / "alias.py"
+    source_file.write_text("def alias():\n    return 1\n")
+    project_root = str(tmp_path)
+    context = _CountingContext()
+    service.clear_partial_load_cache()
+
+    service._partial_load(context, project_root, "alias")
+    service._partial_load(context, project_root, "alias")
+    assert context.calls == 1
+
+    source_file.write_text("def alias(:\n")
+    service._partial_load(context, project_root, "alias")
+    assert context.calls == 2
+
+    source_file.unlink()
+    service._partial_load(context, project_root, "alias")
+    assert context.calls == 3
+
+    service.clear_partial_load_cache()
+    service._partial_load(context, project_root, "alias")
+    assert context.calls == 4
+
+
+def test_prepare_run_task_maps_load_errors_to_warning_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from morph.task import run
+
+    def _raise_load_error(*args: Any, **kwargs: Any) -> None:
+        raise ValueError("Alias not found")
+
+    monkeypatch.setattr(run, "RunTask", _raise_load_error)
+    monkeypatch.setattr(service, "find_project_root_dir", lambda: str(tmp_path))
+    with pytest.raises(WarningError):
+        service._prepare_run_task("alias", None)
@@ -0,0 +1,24 @@
+from click.testing import CliRunner
+
+from morph.cli.main import _COMMAND_HELP, _SUBCOMMANDS, cli
+
+
+def test_every_subcommand_has_help() -> None:
+    assert set(_COMMAND_HELP) == set(_SUBCOMMANDS)
+
+
+def test_group_help_lists_subcommands() -> None:
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name, help_text in _COMMAND_HELP.items():
+        assert name in result.output
+        assert help_text in result.output
+
+
+def test_subcommand_help_uses_the_help_table() -> None:
+    result = CliRunner().invoke(cli, ["deploy", "--help"])
+
+    assert result.exit_code == 0
+    assert _COMMAND_HELP["deploy"] in result.output
+    assert "--cache-from" in result.output
@@ -0,0 +1,40 @@
+import os
+from pathlib import Path
+
+from morph.config.project import load_project
+
+
+def test_load_project_returns_a_copy(tmp_path: Path) -> None:
+    (tmp_path / "morph_project.yml").write_text("profile: default\n")
+
+    project = load_project(str(tmp_path))
+    assert project is not None
+    project.profile = "changed"
+
+    reloaded = load_project(str(tmp_path))
+    assert reloaded is not None
+    assert reloaded.profile == "default"
+
+
+def test_load_project_picks_up_writes_with_the_same_mtime(tmp_path: Path) -> None:
+    config_path = tmp_path / "morph_project.yml"
+    config_path.write_text("profile: default\n")
+    stat = os.stat(config_path)
+    project = load_project(str(tmp_path))
+    assert project is not None and project.profile == "default"
+
+    config_path.write_text("profile: production\n")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    project = load_project(str(tmp_path))
+    assert project is not None and project.profile == "production"
+
+
+def test_load_project_initializes_an_empty_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "morph_project.yml"
+    config_path.write_text("")
+
+    for _ in range(2):
+        assert load_project(str(tmp_path)) is not None
+        assert config_path.read_text() != ""
+        config_path.write_text("")
@@ -0,0 +1,33 @@
+import socket
+
+import pytest
+
+from morph.task.api import ApiTask
+
+
+def _find_available_port(start_port: int) -> int:
+    # the port probe does not depend on the project the task is created for
+    task = ApiTask.__new__(ApiTask)
+    return task._find_available_port(start_port)
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "0.0.0.0"])
+def test_find_available_port_skips_port_in_use(host: str) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind((host, 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+
+        available_port = _find_available_port(port)
+
+    assert available_port != port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("0.0.0.0", available_port))
+
+
+def test_find_available_port_prefers_free_port() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    assert _find_available_port(port) == port
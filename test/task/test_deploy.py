@@ -0,0 +1,54 @@
+import subprocess
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from morph.task import deploy
+from morph.task.deploy import DeployTask
+
+
+def _deploy_task(tmp_path: Path) -> DeployTask:
+    # only the attributes used by _save_docker_image are set up
+    task = DeployTask.__new__(DeployTask)
+    task.output_tar = str(tmp_path / ".morph" / "project.tar")
+    task.image_name = "project:latest"
+    return task
+
+
+def _record_docker_save(monkeypatch: pytest.MonkeyPatch) -> List[List[str]]:
+    calls: List[List[str]] = []
+
+    def _run(command: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        calls.append(command)
+        Path(command[command.index("-o") + 1]).write_bytes(b"tar")
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(deploy.subprocess, "run", _run)
+    return calls
+
+
+def test_save_docker_image_reuses_tar_for_same_digest(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls = _record_docker_save(monkeypatch)
+    task = _deploy_task(tmp_path)
+
+    task._save_docker_image("sha256:a")
+    task._save_docker_image("sha256:a")
+
+    assert len(calls) == 1
+    assert Path(f"{task.output_tar}.digest").read_text() == "sha256:a"
+
+
+def test_save_docker_image_saves_again_for_new_digest(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls = _record_docker_save(monkeypatch)
+    task = _deploy_task(tmp_path)
+
+    task._save_docker_image("sha256:a")
+    task._save_docker_image("sha256:b")
+
+    assert len(calls) == 2
+    assert Path(f"{task.output_tar}.digest").read_text() == "sha256:b"